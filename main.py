@@ -48,7 +48,7 @@ def initialize_new_story(store: JSONMemoryStore) -> None:
         status="active",
         current_location=world_seed['starting_location']['name']
     )
-    memory.characters[protagonist.character_id] = protagonist
+    cast = [protagonist]
     print(f"[OK] Added protagonist: {protagonist.name}")
 
     # Add initial crew
@@ -62,9 +62,11 @@ def initialize_new_story(store: JSONMemoryStore) -> None:
             status="active",
             current_location=world_seed['starting_location']['name']
         )
-        memory.characters[crew_member.character_id] = crew_member
+        cast.append(crew_member)
         print(f"[OK] Added crew member: {crew_member.name}")
 
+    memory.bulk_add_characters(cast)
+
     # Add initial plot threads
     for i, thread_data in enumerate(world_seed.get('initial_threads', []), start=1):
         thread = PlotThread(
@@ -116,6 +118,9 @@ def generate_chapter(
     print(f"GENERATING CHAPTER {memory.current_chapter_number + 1}")
     print("=" * 60)
 
+    # Let the previous chapter's background indexing land before retrieval
+    updater.flush()
+
     # Get current arc
     arc = memory.get_current_arc()
 
@@ -162,7 +167,7 @@ def generate_chapter(
 
                 # Update chapter with revised text
                 chapter.content = revision_result.revised_text
-                chapter.word_count = len(revision_result.revised_text.split())
+                chapter.word_count = revision_result.word_count
             else:
                 print(f"\n[QUALITY] Max revisions reached. Accepting current version.")
                 break
@@ -208,7 +213,7 @@ def main():
 
             # Initialize components with semantic memory
             planner = ChapterPlanner(client, retriever=retriever)
-            writer = ChapterWriter(client)
+            writer = ChapterWriter(client, retriever=retriever)
             updater = StateUpdater(client, vector_store=vector_store)
             semantic_memory_enabled = True
 
@@ -268,8 +273,7 @@ def main():
             vstats = vector_store.get_stats()
             if vstats['chapters'] == 0:
                 print("\n[INDEXING] Building semantic index from existing chapters...")
-                for chapter in memory.chapters.values():
-                    vector_store.add_chapter(chapter)
+                vector_store.add_chapters(list(memory.chapters.values()))
                 for thread in memory.plot_threads.values():
                     vector_store.add_thread(thread)
                 print(f"[OK] Indexed {len(memory.chapters)} chapters and {len(memory.plot_threads)} threads")
@@ -316,6 +320,7 @@ def main():
 
                 # Show vector store stats
                 if semantic_memory_enabled:
+                    updater.flush()
                     vstats = vector_store.get_stats()
                     print(f"\nSemantic Memory:")
                     print(f"  - Chapters indexed: {vstats['chapters']}")
@@ -324,6 +329,7 @@ def main():
 
             elif choice == '3':
                 print("\nExiting Story Writer...")
+                updater.close()
                 break
 
             else:
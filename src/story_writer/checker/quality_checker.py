@@ -2,8 +2,11 @@
 
 import json
 from typing import Optional
+
+import orjson
+
 from ..models import Chapter, StoryMemory, QualityReport
-from ..utils import LLMClient, get_style_guide
+from ..utils import LLMClient, get_style_guide, extract_json_block
 
 
 class QualityChecker:
@@ -185,28 +188,12 @@ Return ONLY valid JSON in this format:
 
     def _parse_quality_response(self, response: str) -> QualityReport:
         """Parse LLM response into QualityReport."""
-        # Extract JSON from response
-        response = response.strip()
-
-        # Remove markdown code blocks if present
-        if response.startswith("```"):
-            lines = response.split("\n")
-            start_idx = 0
-            end_idx = len(lines)
-
-            for i, line in enumerate(lines):
-                if line.strip().startswith("```"):
-                    if start_idx == 0:
-                        start_idx = i + 1
-                    else:
-                        end_idx = i
-                        break
-
-            response = "\n".join(lines[start_idx:end_idx])
+        # Extract JSON from response (strips code fences and surrounding prose)
+        response = extract_json_block(response)
 
         # Parse JSON
         try:
-            data = json.loads(response)
+            data = orjson.loads(response)
         except json.JSONDecodeError as e:
             print(f"[ERROR] Failed to parse quality response: {e}")
             print(f"Response was: {response[:500]}...")
@@ -1,10 +1,12 @@
 """JSON-based memory storage for story state."""
 
-import json
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from ..models import StoryMemory
 
 
@@ -43,8 +45,11 @@ class JSONMemoryStore:
         # Convert to dict and save
         memory_dict = memory.model_dump(mode='json')
 
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(memory_dict, f, indent=2, ensure_ascii=False)
+        with open(self.memory_file, 'wb') as f:
+            f.write(orjson.dumps(
+                memory_dict,
+                option=orjson.OPT_INDENT_2
+            ))
 
         print(f"[OK] Saved story memory to {self.memory_file}")
 
@@ -59,8 +64,8 @@ class JSONMemoryStore:
             print(f"[INFO] No existing memory file found at {self.memory_file}")
             return None
 
-        with open(self.memory_file, 'r', encoding='utf-8') as f:
-            memory_dict = json.load(f)
+        with open(self.memory_file, 'rb') as f:
+            memory_dict = orjson.loads(f.read())
 
         memory = StoryMemory.model_validate(memory_dict)
         print(f"[OK] Loaded story memory from {self.memory_file}")
@@ -80,11 +85,7 @@ class JSONMemoryStore:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_dir / f"story_memory_{timestamp}.json"
 
-        with open(self.memory_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        shutil.copyfile(self.memory_file, backup_file)
 
         print(f"[OK] Created backup: {backup_file.name}")
 
@@ -176,8 +177,8 @@ class JSONMemoryStore:
         if not backup_file.exists():
             raise FileNotFoundError(f"Backup not found: {backup_name}")
 
-        with open(backup_file, 'r', encoding='utf-8') as f:
-            memory_dict = json.load(f)
+        with open(backup_file, 'rb') as f:
+            memory_dict = orjson.loads(f.read())
 
         memory = StoryMemory.model_validate(memory_dict)
         print(f"[OK] Restored from backup: {backup_name}")
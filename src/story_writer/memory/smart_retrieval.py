@@ -78,12 +78,18 @@ class SmartRetriever:
             else:
                 query = f"{memory.saga_goal} {memory.world_name}"
 
+            # Embed once for both the chapter and the event search
+            query_embedding = self.vector_store.embed_query(query)
+
             relevant_results = self.vector_store.search_chapters(
                 query=query,
                 n_results=n_relevant,
-                arc_id=current_arc_id
+                arc_id=current_arc_id,
+                query_embedding=query_embedding
             )
 
+            recent_ids = {ch.chapter_id for ch in recent}
+
             retrieval["relevant_chapters"] = [
                 {
                     "chapter_id": result['id'],
@@ -94,7 +100,7 @@ class SmartRetriever:
                 }
                 for result in relevant_results
                 # Filter out recent chapters we already have
-                if result['id'] not in [ch.chapter_id for ch in recent]
+                if result['id'] not in recent_ids
             ]
 
             print(f"[RETRIEVAL] - {len(retrieval['relevant_chapters'])} relevant chapters")
@@ -102,7 +108,8 @@ class SmartRetriever:
             # 3. Relevant events (fine-grained semantic)
             event_results = self.vector_store.search_events(
                 query=query,
-                n_results=n_relevant * 2
+                n_results=n_relevant * 2,
+                query_embedding=query_embedding
             )
 
             retrieval["relevant_events"] = [
@@ -164,6 +171,43 @@ class SmartRetriever:
 
         return retrieval
 
+    def retrieve_for_writing(
+        self,
+        memory: StoryMemory,
+        query: str,
+        n_events: int = 3
+    ) -> dict:
+        """
+        Retrieve past events relevant to the chapter being written.
+
+        Args:
+            memory: Current story memory
+            query: Search query (e.g. outline summary and key events)
+            n_events: Number of events to retrieve
+
+        Returns:
+            Dictionary with relevant events in chronological order
+        """
+        if not memory.chapters or n_events <= 0:
+            return {"relevant_events": []}
+
+        event_results = self.vector_store.search_events(query=query, n_results=n_events)
+
+        relevant_events = sorted(
+            (
+                {
+                    "event": result['document'],
+                    "chapter_number": result['metadata']['chapter_number']
+                }
+                for result in event_results
+            ),
+            key=lambda e: e["chapter_number"]
+        )
+
+        print(f"[RETRIEVAL] - {len(relevant_events)} relevant events for writing")
+
+        return {"relevant_events": relevant_events}
+
     def search_character_history(
         self,
         character_name: str,
@@ -217,12 +261,7 @@ class SmartRetriever:
         Returns:
             List of developments in chronological order
         """
-        # Find the thread
-        thread = None
-        for t in memory.plot_threads.values():
-            if t.name == thread_name:
-                thread = t
-                break
+        thread = memory.get_thread_by_name(thread_name)
 
         if not thread:
             return []
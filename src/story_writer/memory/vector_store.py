@@ -60,42 +60,68 @@ class VectorMemoryStore:
         Args:
             chapter: Chapter to add
         """
-        # Create embedding from summary and key events
-        text_to_embed = f"{chapter.title}\n{chapter.summary}\n" + \
-                       "\n".join(chapter.key_events)
+        self.add_chapters([chapter])
 
-        embedding = self.embedding_model.encode(text_to_embed).tolist()
-
-        # Store in collection
-        self.chapters_collection.add(
-            ids=[chapter.chapter_id],
-            embeddings=[embedding],
-            documents=[text_to_embed],
-            metadatas=[{
-                "chapter_number": chapter.chapter_number,
-                "arc_id": chapter.arc_id,
-                "title": chapter.title,
-                "cliffhanger_type": chapter.cliffhanger_type
-            }]
-        )
+    def add_chapters(self, chapters: list[Chapter]) -> None:
+        """
+        Add several chapters to the vector store.
 
-        # Add individual events
-        for i, event in enumerate(chapter.key_events):
-            event_id = f"{chapter.chapter_id}_event_{i}"
-            event_embedding = self.embedding_model.encode(event).tolist()
+        Chapter texts and all of their events are embedded in a single
+        batched encode call, then written with one add per collection.
 
-            self.events_collection.add(
-                ids=[event_id],
-                embeddings=[event_embedding],
-                documents=[event],
-                metadatas=[{
+        Args:
+            chapters: Chapters to add
+        """
+        if not chapters:
+            return
+
+        # Create embedding text from summary and key events
+        chapter_texts = [
+            f"{chapter.title}\n{chapter.summary}\n" + "\n".join(chapter.key_events)
+            for chapter in chapters
+        ]
+
+        event_ids = []
+        event_texts = []
+        event_metadatas = []
+        for chapter in chapters:
+            for i, event in enumerate(chapter.key_events):
+                event_ids.append(f"{chapter.chapter_id}_event_{i}")
+                event_texts.append(event)
+                event_metadatas.append({
                     "chapter_id": chapter.chapter_id,
                     "chapter_number": chapter.chapter_number,
                     "event_index": i
-                }]
+                })
+
+        embeddings = self.embedding_model.encode(chapter_texts + event_texts).tolist()
+
+        # Store in collections
+        self.chapters_collection.add(
+            ids=[chapter.chapter_id for chapter in chapters],
+            embeddings=embeddings[:len(chapters)],
+            documents=chapter_texts,
+            metadatas=[
+                {
+                    "chapter_number": chapter.chapter_number,
+                    "arc_id": chapter.arc_id,
+                    "title": chapter.title,
+                    "cliffhanger_type": chapter.cliffhanger_type
+                }
+                for chapter in chapters
+            ]
+        )
+
+        if event_texts:
+            self.events_collection.add(
+                ids=event_ids,
+                embeddings=embeddings[len(chapters):],
+                documents=event_texts,
+                metadatas=event_metadatas
             )
 
-        print(f"[VECTOR] Added chapter {chapter.chapter_id} with {len(chapter.key_events)} events")
+        for chapter in chapters:
+            print(f"[VECTOR] Added chapter {chapter.chapter_id} with {len(chapter.key_events)} events")
 
     def add_thread(self, thread: PlotThread) -> None:
         """
@@ -119,11 +145,21 @@ class VectorMemoryStore:
             }]
         )
 
+    def embed_query(self, query: str) -> list[float]:
+        """
+        Embed a search query.
+
+        Embed once and pass the result as `query_embedding` to run several
+        searches for the same query without re-encoding it.
+        """
+        return self.embedding_model.encode(query).tolist()
+
     def search_chapters(
         self,
         query: str,
         n_results: int = 5,
-        arc_id: Optional[str] = None
+        arc_id: Optional[str] = None,
+        query_embedding: Optional[list[float]] = None
     ) -> list[dict]:
         """
         Semantic search for relevant chapters.
@@ -132,11 +168,13 @@ class VectorMemoryStore:
             query: Search query
             n_results: Number of results to return
             arc_id: Optional arc filter
+            query_embedding: Precomputed embedding of `query` (optional)
 
         Returns:
             List of relevant chapters with metadata
         """
-        query_embedding = self.embedding_model.encode(query).tolist()
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
 
         where_filter = {"arc_id": arc_id} if arc_id else None
 
@@ -151,7 +189,8 @@ class VectorMemoryStore:
     def search_events(
         self,
         query: str,
-        n_results: int = 10
+        n_results: int = 10,
+        query_embedding: Optional[list[float]] = None
     ) -> list[dict]:
         """
         Semantic search for relevant events.
@@ -159,11 +198,13 @@ class VectorMemoryStore:
         Args:
             query: Search query
             n_results: Number of results to return
+            query_embedding: Precomputed embedding of `query` (optional)
 
         Returns:
             List of relevant events with metadata
         """
-        query_embedding = self.embedding_model.encode(query).tolist()
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
 
         results = self.events_collection.query(
             query_embeddings=[query_embedding],
@@ -189,7 +230,7 @@ class VectorMemoryStore:
         Returns:
             List of relevant threads with metadata
         """
-        query_embedding = self.embedding_model.encode(query).tolist()
+        query_embedding = self.embed_query(query)
 
         where_filter = {"status": status} if status else None
 
@@ -79,6 +79,10 @@ class RevisionResult(BaseModel):
     revised_text: str = Field(
         description="The revised chapter text"
     )
+    word_count: int = Field(
+        default=0,
+        description="Word count of the revised text"
+    )
     revision_notes: str = Field(
         description="What was changed and why"
     )
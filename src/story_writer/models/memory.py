@@ -1,8 +1,8 @@
 """Main story memory model."""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Iterable, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .chapter import Chapter
 from .arc import Arc
@@ -12,6 +12,49 @@ from .thread import PlotThread
 from .tracker import CharacterAlias, Relationship, WorldEvent
 
 
+class _NameIndex:
+    """Name -> ID index over one of the ID-keyed entity dicts."""
+
+    def __init__(self):
+        self.ids: dict[str, str] = {}
+        self.size = -1  # Entity count at last rebuild
+
+    def lookup(self, entities: dict, name: str):
+        """
+        Look up an entity by name.
+
+        Entities are added to the ID-keyed dicts directly all over the
+        codebase, so the index rebuilds itself whenever the dict size changed
+        since the last build or a hit points at a missing/renamed entity.
+        Misses are answered from the index as is, keeping them O(1); code
+        that renames or replaces entities in place must call invalidate().
+        """
+        if self.size != len(entities):
+            self.rebuild(entities)
+
+        entity_id = self.ids.get(name)
+        if entity_id is None:
+            return None
+
+        entity = entities.get(entity_id)
+        if entity is None or entity.name != name:
+            self.rebuild(entities)
+            entity = entities.get(self.ids.get(name))
+
+        return entity
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        self.size = -1
+
+    def rebuild(self, entities: dict) -> None:
+        """Rebuild from scratch, keeping the first ID for duplicate names."""
+        self.ids.clear()
+        for entity_id, entity in entities.items():
+            self.ids.setdefault(entity.name, entity_id)
+        self.size = len(entities)
+
+
 class StoryMemory(BaseModel):
     """Complete story state and memory."""
 
@@ -121,6 +164,11 @@ class StoryMemory(BaseModel):
         description="Chronological list of major world events"
     )
 
+    # Name -> ID lookup indexes (not serialized, rebuilt lazily)
+    _character_names: _NameIndex = PrivateAttr(default_factory=_NameIndex)
+    _location_names: _NameIndex = PrivateAttr(default_factory=_NameIndex)
+    _thread_names: _NameIndex = PrivateAttr(default_factory=_NameIndex)
+
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
@@ -130,10 +178,33 @@ class StoryMemory(BaseModel):
         """Get character by ID."""
         return self.characters.get(char_id)
 
+    def bulk_add_characters(self, characters: Iterable[Character]) -> None:
+        """
+        Add (or replace) several characters in one dict update.
+
+        Args:
+            characters: Characters to add, keyed by their character_id
+        """
+        self.characters.update({char.character_id: char for char in characters})
+        # Replacing an existing ID can rename without changing the dict size
+        self._character_names.invalidate()
+
     def get_location(self, loc_id: str) -> Optional[WorldLocation]:
         """Get location by ID."""
         return self.locations.get(loc_id)
 
+    def get_character_by_name(self, name: str) -> Optional[Character]:
+        """Get character by exact name (first match in insertion order)."""
+        return self._character_names.lookup(self.characters, name)
+
+    def get_location_by_name(self, name: str) -> Optional[WorldLocation]:
+        """Get location by exact name (first match in insertion order)."""
+        return self._location_names.lookup(self.locations, name)
+
+    def get_thread_by_name(self, name: str) -> Optional[PlotThread]:
+        """Get plot thread by exact name (first match in insertion order)."""
+        return self._thread_names.lookup(self.plot_threads, name)
+
     def get_current_arc(self) -> Optional[Arc]:
         """Get the current arc."""
         if self.current_arc_id:
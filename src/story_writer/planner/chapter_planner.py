@@ -3,8 +3,10 @@
 import json
 from typing import Optional
 
+import orjson
+
 from ..models import StoryMemory, ChapterOutline, Arc
-from ..utils import LLMClient, get_style_guide
+from ..utils import LLMClient, get_style_guide, extract_json_block
 
 
 class ChapterPlanner:
@@ -37,26 +39,67 @@ class ChapterPlanner:
         Returns:
             ChapterOutline with structured plan
         """
-        next_chapter_num = memory.current_chapter_number + 1
+        next_chapter_num, prompt = self._prepare_plan(memory, arc)
 
-        print(f"\n[PLANNER] Planning Chapter {next_chapter_num}...")
+        print(f"[PLANNER] Generating outline with LLM...")
+        response = self.client.generate(
+            prompt=prompt,
+            system_prompt=self._create_system_prompt(),
+            temperature=0.7  # Slightly structured for planning
+        )
 
-        # Build context
-        context = self._build_planning_context(memory, arc)
+        return self._finish_plan(response, next_chapter_num, arc)
+
+    async def aplan_chapter(
+        self,
+        memory: StoryMemory,
+        arc: Optional[Arc] = None
+    ) -> ChapterOutline:
+        """
+        Plan the next chapter without blocking the event loop.
 
-        # Generate outline
-        prompt = self._create_planning_prompt(context, next_chapter_num)
-        system_prompt = self._create_system_prompt()
+        The prompt is built from `memory` before the first await, so later
+        changes to memory don't affect an in-flight plan.
+
+        Args:
+            memory: Current story memory
+            arc: Current arc (optional)
+
+        Returns:
+            ChapterOutline with structured plan
+        """
+        next_chapter_num, prompt = self._prepare_plan(memory, arc)
 
         print(f"[PLANNER] Generating outline with LLM...")
-        response = self.client.generate(
+        response = await self.client.agenerate(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=self._create_system_prompt(),
             temperature=0.7  # Slightly structured for planning
         )
 
-        # Parse response into ChapterOutline
-        outline = self._parse_outline_response(response, next_chapter_num, arc)
+        return self._finish_plan(response, next_chapter_num, arc)
+
+    def _prepare_plan(
+        self,
+        memory: StoryMemory,
+        arc: Optional[Arc]
+    ) -> tuple[int, str]:
+        """Build the planning prompt for the next chapter."""
+        next_chapter_num = memory.current_chapter_number + 1
+
+        print(f"\n[PLANNER] Planning Chapter {next_chapter_num}...")
+
+        context = self._build_planning_context(memory, arc)
+        return next_chapter_num, self._create_planning_prompt(context, next_chapter_num)
+
+    def _finish_plan(
+        self,
+        response: str,
+        chapter_num: int,
+        arc: Optional[Arc]
+    ) -> ChapterOutline:
+        """Parse the planning response into a ChapterOutline."""
+        outline = self._parse_outline_response(response, chapter_num, arc)
 
         print(f"[OK] Chapter outline created")
         print(f"    - Title: {outline.title}")
@@ -257,29 +300,12 @@ Return ONLY valid JSON in this exact format:
         arc: Optional[Arc]
     ) -> ChapterOutline:
         """Parse LLM response into ChapterOutline."""
-        # Extract JSON from response (might have markdown code blocks)
-        response = response.strip()
-
-        # Remove markdown code blocks if present
-        if response.startswith("```"):
-            lines = response.split("\n")
-            # Find first and last ``` and extract content between
-            start_idx = 0
-            end_idx = len(lines)
-
-            for i, line in enumerate(lines):
-                if line.strip().startswith("```"):
-                    if start_idx == 0:
-                        start_idx = i + 1
-                    else:
-                        end_idx = i
-                        break
-
-            response = "\n".join(lines[start_idx:end_idx])
+        # Extract JSON from response (strips code fences and surrounding prose)
+        response = extract_json_block(response)
 
         # Parse JSON
         try:
-            data = json.loads(response)
+            data = orjson.loads(response)
         except json.JSONDecodeError as e:
             print(f"[ERROR] Failed to parse JSON response: {e}")
             print(f"Response was: {response[:500]}...")
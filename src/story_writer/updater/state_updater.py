@@ -1,25 +1,177 @@
 """State updater to extract changes from chapters and update memory."""
 
+import asyncio
 import json
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional
 
-from ..models import StoryMemory, Chapter
+from ..models import StoryMemory, Chapter, Character, PlotThread, Relationship, WorldEvent
 from ..utils import LLMClient
+from ..utils.json_utils import parse_json_lenient
+
+
+_EXTRACTION_SYSTEM_PROMPT = """You are a story analysis expert. Extract factual state changes from narrative text.
+Focus on concrete, verifiable changes like:
+- New characters introduced (named characters who appear or speak)
+- Character injuries, captures, or status changes
+- Locations discovered, destroyed, or modified
+- Plot threads introduced, advanced, or resolved
+
+For new characters, only include those with names or significant roles (not unnamed "townspeople" or "guards").
+Be conservative - only report changes explicitly stated or strongly implied in the text."""
+
+_EXTRACTION_FIELDS = """1. NEW CHARACTERS: Characters introduced or mentioned for the first time
+   Format: [{"name": "Name", "role": "protagonist/antagonist/ally/mentor/neutral", "personality": "brief description", "first_description": "how they were introduced"}]
+
+2. CHARACTER UPDATES: Changes to existing character states, locations, or possessions
+   Format: [{"character_name": "Name", "updates": {"status": "injured/captured/etc", "location": "new location", "items_gained": ["item"], "items_lost": ["item"]}}]
+
+3. LOCATION UPDATES: Changes to locations (destroyed, modified, discovered)
+   Format: [{"location_name": "Name", "change": "description of change", "status": "active/destroyed"}]
+
+4. THREAD UPDATES: Progress on existing plot threads or new threads introduced
+   Format: [{"action": "progress/resolve/introduce", "thread_name": "Name", "description": "what happened"}]
+
+5. RELATIONSHIPS: Character relationships mentioned or established
+   Format: [{"character_a": "Name", "character_b": "Name", "type": "ally/friend/rival/enemy/mentor/family", "description": "context"}]
+
+6. MAJOR EVENTS: Significant events worth tracking in timeline
+   Format: [{"description": "what happened", "type": "battle/discovery/death/alliance/betrayal/revelation", "impact": "minor/moderate/major/critical"}]
+
+"""
+
+_EXTRACTION_RETURN_FORMAT = """{
+  "new_characters": [...],
+  "character_updates": [...],
+  "location_updates": [...],
+  "thread_updates": [...],
+  "relationships": [...],
+  "major_events": [...]
+}
+
+If no changes in a category, use empty array []."""
+
+# Extraction prompts with the static instructions baked in; only the
+# chapter-specific parts are %-formatted per call
+_EXTRACTION_TMPL = """Analyze this chapter and extract state changes.
+
+CHAPTER: %s
+CONTENT:
+%s
+
+Extract the following information in JSON format:
+
+""" + _EXTRACTION_FIELDS + """Return ONLY valid JSON in this format:
+""" + _EXTRACTION_RETURN_FORMAT
+
+_BATCH_EXTRACTION_TMPL = """Analyze each chapter below and extract its state changes.
+The chapters are consecutive: report each change under the chapter where it happens.
+
+%s
+
+For EACH chapter, extract the following information in JSON format:
+
+""" + _EXTRACTION_FIELDS + """Return ONLY one valid JSON object keyed by chapter id (%s).
+The value for each chapter uses this format:
+""" + _EXTRACTION_RETURN_FORMAT
+
+# Output token budget for one chapter's extraction
+_EXTRACTION_MAX_TOKENS = 2000
+
+# Top-level categories of an extraction response
+_CHANGE_KEYS = (
+    "new_characters",
+    "character_updates",
+    "location_updates",
+    "thread_updates",
+    "relationships",
+    "major_events",
+)
+
+
+def _empty_changes() -> dict:
+    """Build a changes dict with every category empty."""
+    return {key: [] for key in _CHANGE_KEYS}
+
+
+def _normalize_character_name(name: str) -> str:
+    """
+    Normalize character name for deduplication.
+
+    Examples:
+    - "The Mysterious Informant" -> "mysterious informant"
+    - "Unnamed Guard Leader" -> "guard leader"
+    - "Zephyr" -> "zephyr"
+    - "Sky Captain" -> "sky captain"
+    """
+    if not name:
+        return ""
+
+    # Remove common articles and convert to lowercase
+    normalized = name.lower().strip()
+
+    # Remove leading articles
+    for article in ["the ", "a ", "an "]:
+        if normalized.startswith(article):
+            normalized = normalized[len(article):]
+
+    # Remove "unnamed" prefix
+    if normalized.startswith("unnamed "):
+        normalized = normalized[8:]  # Remove "unnamed "
+
+    # Remove extra whitespace
+    normalized = " ".join(normalized.split())
+
+    return normalized
+
+
+# Leading articles dropped from thread names (applied to lowercased names)
+_THREAD_ARTICLES_RE = re.compile(r"^(?:the )?(?:a )?(?:an )?")
+
+
+def _normalize_thread_names(names: list[str]) -> list[str]:
+    """
+    Normalize plot thread names for deduplication, in one pass.
+
+    Examples:
+    - "Wind Walker Prophecy" -> "wind walker prophecy"
+    - "The Wind Walker prophecy" -> "wind walker prophecy"
+    - "Wind Walker prophecy" -> "wind walker prophecy"
+    """
+    strip_articles = _THREAD_ARTICLES_RE.sub
+    return [
+        " ".join(strip_articles("", (name or "").lower().strip(), count=1).split())
+        for name in names
+    ]
 
 
 class StateUpdater:
     """Extracts state changes from chapters and updates memory."""
 
-    def __init__(self, llm_client: LLMClient, vector_store=None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        vector_store=None,
+        extraction_batch_size: int = 3
+    ):
         """
         Initialize state updater.
 
         Args:
             llm_client: LLM client for extraction
             vector_store: Optional VectorMemoryStore for semantic indexing
+            extraction_batch_size: Max chapters coalesced into one extraction
+                call when updating from several chapters
         """
         self.client = llm_client
         self.vector_store = vector_store
+        self.extraction_batch_size = extraction_batch_size
+
+        # Embedding calls run on a single background worker so indexing
+        # doesn't block the next chapter; one worker keeps writes ordered.
+        self._index_pool = ThreadPoolExecutor(max_workers=1) if vector_store else None
+        self._index_futures: list[Future] = []
 
     def update_from_chapter(self, chapter: Chapter, memory: StoryMemory) -> StoryMemory:
         """
@@ -34,23 +186,121 @@ class StateUpdater:
         """
         print(f"\n[UPDATER] Updating memory from Chapter {chapter.chapter_number}...")
 
-        # Add chapter to memory
-        memory.chapters[chapter.chapter_id] = chapter
-        memory.current_chapter_number = chapter.chapter_number
-
         # Extract state changes using LLM
         print(f"[UPDATER] Extracting state changes...")
         changes = self._extract_state_changes(chapter)
 
-        # Apply changes to memory
-        self._apply_new_characters(changes.get("new_characters", []), memory, chapter)
-        self._apply_character_updates(changes.get("character_updates", []), memory)
-        self._apply_location_updates(changes.get("location_updates", []), memory)
-        self._apply_thread_updates(changes.get("thread_updates", []), memory, chapter)
+        self._apply_changes(changes, memory, chapter)
+
+        print(f"[OK] Memory updated successfully")
+
+        return memory
+
+    async def update_from_chapters(
+        self,
+        chapters: list[Chapter],
+        memory: StoryMemory
+    ) -> StoryMemory:
+        """
+        Update story memory from several completed chapters.
+
+        Chapters are coalesced into groups of up to `extraction_batch_size`
+        (fewer if the model's output limit can't fit that many chapters),
+        each extracted with a single LLM call; the groups are requested
+        concurrently (bucketed by length) and the resulting changes applied
+        in chapter order.
+
+        Args:
+            chapters: The completed chapters
+            memory: Current story memory
+
+        Returns:
+            Updated story memory
+        """
+        chapters = sorted(chapters, key=lambda ch: ch.chapter_number)
+        size = max(1, min(
+            self.extraction_batch_size,
+            self.client.default_max_tokens // _EXTRACTION_MAX_TOKENS
+        ))
+        groups = [chapters[i:i + size] for i in range(0, len(chapters), size)]
+
+        print(f"\n[UPDATER] Extracting state changes from {len(chapters)} chapter(s) "
+              f"in {len(groups)} request(s)...")
+
+        # Output budget scales with group size, so groups of each size go out
+        # as their own concurrent call (only the last group can be smaller)
+        by_size: dict[int, list[int]] = {}
+        for i, group in enumerate(groups):
+            by_size.setdefault(len(group), []).append(i)
+
+        sized_responses = await asyncio.gather(*(
+            self.client.agenerate_many(
+                [self._create_group_extraction_prompt(groups[i]) for i in indices],
+                system_prompt=_EXTRACTION_SYSTEM_PROMPT,
+                temperature=0.3,  # Low temperature for factual extraction
+                max_tokens=_EXTRACTION_MAX_TOKENS * group_size,
+                length_estimates=[
+                    sum(self.client.count_tokens_estimate(ch.content) for ch in groups[i])
+                    for i in indices
+                ]
+            )
+            for group_size, indices in by_size.items()
+        ))
+
+        responses = [None] * len(groups)
+        for indices, texts in zip(by_size.values(), sized_responses):
+            for i, text in zip(indices, texts):
+                responses[i] = text
+
+        all_changes = {}
+        for group, response in zip(groups, responses):
+            if len(group) == 1:
+                all_changes[group[0].chapter_id] = self._parse_state_changes(response)
+            else:
+                all_changes.update(self._parse_batch_state_changes(response, group))
+
+        # Retry chapters a batched response left out, one call each
+        missing = [ch for ch in chapters if ch.chapter_id not in all_changes]
+        if missing:
+            responses = await self.client.agenerate_many(
+                [self._create_extraction_prompt(ch) for ch in missing],
+                system_prompt=_EXTRACTION_SYSTEM_PROMPT,
+                temperature=0.3,
+                max_tokens=_EXTRACTION_MAX_TOKENS
+            )
+            for chapter, response in zip(missing, responses):
+                all_changes[chapter.chapter_id] = self._parse_state_changes(response)
+
+        for chapter in chapters:
+            print(f"\n[UPDATER] Updating memory from Chapter {chapter.chapter_number}...")
+            self._apply_changes(all_changes[chapter.chapter_id], memory, chapter)
+
+        print(f"[OK] Memory updated successfully")
+
+        return memory
+
+    def _apply_changes(self, changes: dict, memory: StoryMemory, chapter: Chapter) -> None:
+        """Apply extracted state changes for one chapter to memory."""
+        # Add chapter to memory
+        memory.chapters[chapter.chapter_id] = chapter
+        memory.current_chapter_number = chapter.chapter_number
+
+        # Apply changes to memory (skip categories with nothing to apply)
+        if new_chars := changes.get("new_characters"):
+            self._apply_new_characters(new_chars, memory, chapter)
+        if char_updates := changes.get("character_updates"):
+            self._apply_character_updates(char_updates, memory)
+        if loc_updates := changes.get("location_updates"):
+            self._apply_location_updates(loc_updates, memory)
+        new_threads = []
+        if thread_updates := changes.get("thread_updates"):
+            new_threads = self._apply_thread_updates(thread_updates, memory, chapter)
 
         # Apply enhanced tracking
-        self._apply_relationships(changes.get("relationships", []), memory, chapter)
-        self._apply_timeline_events(changes.get("major_events", []), memory, chapter)
+        if relationships := changes.get("relationships"):
+            self._apply_relationships(relationships, memory, chapter)
+        if events := changes.get("major_events"):
+            self._apply_timeline_events(events, memory, chapter)
 
         # Update arc progress
         if memory.current_arc_id:
@@ -63,19 +313,38 @@ class StateUpdater:
         for theme in chapter.themes:
             memory.theme_counts[theme] = memory.theme_counts.get(theme, 0) + 1
 
-        # Index in vector store
+        # Index in vector store (in the background)
         if self.vector_store:
             print(f"[UPDATER] Indexing chapter in vector store...")
-            self.vector_store.add_chapter(chapter)
+            self._submit_index(self.vector_store.add_chapter, chapter)
 
-            # Index any new threads
-            for thread_id, thread in memory.plot_threads.items():
-                if thread.setup_chapter == chapter.chapter_id:
-                    self.vector_store.add_thread(thread)
+            # Index threads introduced by this chapter
+            for thread in new_threads:
+                self._submit_index(self.vector_store.add_thread, thread)
 
-        print(f"[OK] Memory updated successfully")
+    def flush(self) -> None:
+        """Wait for all pending vector store indexing to finish."""
+        if not self._index_futures:
+            return
 
-        return memory
+        wait(self._index_futures)
+        for future in self._index_futures:
+            error = future.exception()
+            if error:
+                print(f"[WARN] Vector store indexing failed: {error}")
+        self._index_futures.clear()
+
+    def close(self) -> None:
+        """Finish pending indexing and shut down the background worker."""
+        self.flush()
+        if self._index_pool:
+            self._index_pool.shutdown(wait=True)
+            self._index_pool = None
+
+    def _submit_index(self, fn, item) -> None:
+        """Queue a vector store call on the background indexing worker."""
+        self._index_futures = [f for f in self._index_futures if not f.done() or f.exception()]
+        self._index_futures.append(self._index_pool.submit(fn, item))
 
     def _extract_state_changes(self, chapter: Chapter) -> dict:
         """
@@ -87,89 +356,77 @@ class StateUpdater:
         Returns:
             Dictionary of state changes
         """
-        prompt = f"""Analyze this chapter and extract state changes.
-
-CHAPTER: {chapter.title}
-CONTENT:
-{chapter.content}
-
-Extract the following information in JSON format:
-
-1. NEW CHARACTERS: Characters introduced or mentioned for the first time
-   Format: [{{"name": "Name", "role": "protagonist/antagonist/ally/mentor/neutral", "personality": "brief description", "first_description": "how they were introduced"}}]
-
-2. CHARACTER UPDATES: Changes to existing character states, locations, or possessions
-   Format: [{{"character_name": "Name", "updates": {{"status": "injured/captured/etc", "location": "new location", "items_gained": ["item"], "items_lost": ["item"]}}}}]
-
-3. LOCATION UPDATES: Changes to locations (destroyed, modified, discovered)
-   Format: [{{"location_name": "Name", "change": "description of change", "status": "active/destroyed"}}]
+        response = self.client.generate(
+            prompt=self._create_extraction_prompt(chapter),
+            system_prompt=_EXTRACTION_SYSTEM_PROMPT,
+            temperature=0.3,  # Low temperature for factual extraction
+            max_tokens=_EXTRACTION_MAX_TOKENS
+        )
 
-4. THREAD UPDATES: Progress on existing plot threads or new threads introduced
-   Format: [{{"action": "progress/resolve/introduce", "thread_name": "Name", "description": "what happened"}}]
+        return self._parse_state_changes(response)
 
-5. RELATIONSHIPS: Character relationships mentioned or established
-   Format: [{{"character_a": "Name", "character_b": "Name", "type": "ally/friend/rival/enemy/mentor/family", "description": "context"}}]
+    def _create_extraction_prompt(self, chapter: Chapter) -> str:
+        """Create the state extraction prompt for a chapter."""
+        return _EXTRACTION_TMPL % (chapter.title, chapter.content)
 
-6. MAJOR EVENTS: Significant events worth tracking in timeline
-   Format: [{{"description": "what happened", "type": "battle/discovery/death/alliance/betrayal/revelation", "impact": "minor/moderate/major/critical"}}]
+    def _create_group_extraction_prompt(self, group: list[Chapter]) -> str:
+        """Create the extraction prompt for a group of one or more chapters."""
+        if len(group) == 1:
+            return self._create_extraction_prompt(group[0])
+        return self._create_batch_extraction_prompt(group)
 
-Return ONLY valid JSON in this format:
-{{
-  "new_characters": [...],
-  "character_updates": [...],
-  "location_updates": [...],
-  "thread_updates": [...],
-  "relationships": [...],
-  "major_events": [...]
-}}
+    def _create_batch_extraction_prompt(self, chapters: list[Chapter]) -> str:
+        """Create one state extraction prompt covering several chapters."""
+        chapter_blocks = "\n\n".join(
+            f'<chapter id="{ch.chapter_id}">\nCHAPTER: {ch.title}\nCONTENT:\n{ch.content}\n</chapter>'
+            for ch in chapters
+        )
+        ids = ", ".join(f'"{ch.chapter_id}"' for ch in chapters)
 
-If no changes in a category, use empty array []."""
+        return _BATCH_EXTRACTION_TMPL % (chapter_blocks, ids)
 
-        system_prompt = """You are a story analysis expert. Extract factual state changes from narrative text.
-Focus on concrete, verifiable changes like:
-- New characters introduced (named characters who appear or speak)
-- Character injuries, captures, or status changes
-- Locations discovered, destroyed, or modified
-- Plot threads introduced, advanced, or resolved
+    def _parse_state_changes(self, response: str) -> dict:
+        """Parse the LLM extraction response into a changes dict."""
+        try:
+            changes = parse_json_lenient(response)
+        except json.JSONDecodeError as e:
+            print(f"[WARN] Failed to parse state changes: {e}")
+            print(f"         Using empty changes")
+            return _empty_changes()
 
-For new characters, only include those with names or significant roles (not unnamed "townspeople" or "guards").
-Be conservative - only report changes explicitly stated or strongly implied in the text."""
+        if not isinstance(changes, dict):
+            print(f"[WARN] State changes were not a JSON object, using empty changes")
+            return _empty_changes()
 
-        response = self.client.generate(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=0.3,  # Low temperature for factual extraction
-            max_tokens=2000
-        )
+        return changes
 
-        # Parse JSON response
-        response = response.strip()
-        if response.startswith("```"):
-            lines = response.split("\n")
-            start_idx = 0
-            end_idx = len(lines)
-            for i, line in enumerate(lines):
-                if line.strip().startswith("```"):
-                    if start_idx == 0:
-                        start_idx = i + 1
-                    else:
-                        end_idx = i
-                        break
-            response = "\n".join(lines[start_idx:end_idx])
+    def _parse_batch_state_changes(
+        self,
+        response: str,
+        chapters: list[Chapter]
+    ) -> dict[str, dict]:
+        """
+        Parse a multi-chapter extraction response into per-chapter changes.
 
+        Chapters missing from the response are left out, so the caller can
+        re-extract them on their own instead of applying empty changes.
+        """
         try:
-            changes = json.loads(response)
+            data = parse_json_lenient(response)
         except json.JSONDecodeError as e:
-            print(f"[WARN] Failed to parse state changes: {e}")
-            print(f"         Using empty changes")
-            changes = {
-                "new_characters": [],
-                "character_updates": [],
-                "location_updates": [],
-                "thread_updates": [],
-                "relationships": [],
-                "major_events": []
-            }
+            print(f"[WARN] Failed to parse batched state changes: {e}")
+            data = {}
+
+        if not isinstance(data, dict):
+            data = {}
+
+        changes = {}
+        for chapter in chapters:
+            chapter_changes = data.get(chapter.chapter_id)
+            if isinstance(chapter_changes, dict):
+                changes[chapter.chapter_id] = chapter_changes
+            else:
+                print(f"[WARN] No state changes returned for {chapter.chapter_id}, extracting separately")
 
         return changes
 
@@ -180,26 +437,19 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         chapter: Chapter
     ) -> None:
         """Add newly introduced characters to memory with smart deduplication."""
-        if not new_chars:
-            return
-
         print(f"[UPDATER] Adding {len(new_chars)} new character(s)...")
 
-        from ..models import Character
+        # Normalize existing names once per batch (first match wins, as before)
+        existing_by_name = {}
+        for char in memory.characters.values():
+            existing_by_name.setdefault(_normalize_character_name(char.name), char)
 
         for char_data in new_chars:
             char_name = char_data.get("name")
 
             # Smart deduplication: normalize name and check for similar matches
-            normalized_new_name = self._normalize_character_name(char_name)
-
-            # Check for existing character with similar name
-            existing_char = None
-            for char in memory.characters.values():
-                normalized_existing = self._normalize_character_name(char.name)
-                if normalized_existing == normalized_new_name:
-                    existing_char = char
-                    break
+            normalized_new_name = _normalize_character_name(char_name)
+            existing_char = existing_by_name.get(normalized_new_name)
 
             if existing_char:
                 print(f"         - '{char_name}' matches existing '{existing_char.name}', skipping")
@@ -230,62 +480,20 @@ Be conservative - only report changes explicitly stated or strongly implied in t
             )
 
             memory.characters[char_id] = new_char
+            existing_by_name.setdefault(normalized_new_name, new_char)
             print(f"         - Added '{char_name}' ({new_char.role})")
 
     def _normalize_character_name(self, name: str) -> str:
-        """
-        Normalize character name for deduplication.
-
-        Examples:
-        - "The Mysterious Informant" -> "mysterious informant"
-        - "Unnamed Guard Leader" -> "guard leader"
-        - "Zephyr" -> "zephyr"
-        - "Sky Captain" -> "sky captain"
-        """
-        if not name:
-            return ""
-
-        # Remove common articles and convert to lowercase
-        normalized = name.lower().strip()
-
-        # Remove leading articles
-        for article in ["the ", "a ", "an "]:
-            if normalized.startswith(article):
-                normalized = normalized[len(article):]
-
-        # Remove "unnamed" prefix
-        if normalized.startswith("unnamed "):
-            normalized = normalized[8:]  # Remove "unnamed "
-
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
-
-        return normalized
+        """Normalize character name for deduplication."""
+        return _normalize_character_name(name)
 
     def _normalize_thread_name(self, name: str) -> str:
-        """
-        Normalize plot thread name for deduplication.
-
-        Examples:
-        - "Wind Walker Prophecy" -> "wind walker prophecy"
-        - "The Wind Walker prophecy" -> "wind walker prophecy"
-        - "Wind Walker prophecy" -> "wind walker prophecy"
-        """
-        if not name:
-            return ""
+        """Normalize plot thread name for deduplication."""
+        return self._normalize_thread_names([name])[0]
 
-        # Remove common articles and convert to lowercase
-        normalized = name.lower().strip()
-
-        # Remove leading articles
-        for article in ["the ", "a ", "an "]:
-            if normalized.startswith(article):
-                normalized = normalized[len(article):]
-
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
-
-        return normalized
+    def _normalize_thread_names(self, names: list[str]) -> list[str]:
+        """Normalize several plot thread names for deduplication."""
+        return _normalize_thread_names(names)
 
     def _apply_character_updates(
         self,
@@ -293,21 +501,13 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         memory: StoryMemory
     ) -> None:
         """Apply character updates to memory."""
-        if not updates:
-            return
-
         print(f"[UPDATER] Applying {len(updates)} character update(s)...")
 
         for update_data in updates:
             char_name = update_data.get("character_name")
             updates_dict = update_data.get("updates", {})
 
-            # Find character by name
-            character = None
-            for char in memory.characters.values():
-                if char.name == char_name:
-                    character = char
-                    break
+            character = memory.get_character_by_name(char_name)
 
             if not character:
                 print(f"         - Warning: Character '{char_name}' not found in memory")
@@ -341,9 +541,6 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         memory: StoryMemory
     ) -> None:
         """Apply location updates to memory."""
-        if not updates:
-            return
-
         print(f"[UPDATER] Applying {len(updates)} location update(s)...")
 
         for update_data in updates:
@@ -351,12 +548,7 @@ Be conservative - only report changes explicitly stated or strongly implied in t
             change = update_data.get("change")
             status = update_data.get("status")
 
-            # Find location by name
-            location = None
-            for loc in memory.locations.values():
-                if loc.name == loc_name:
-                    location = loc
-                    break
+            location = memory.get_location_by_name(loc_name)
 
             if location:
                 if status:
@@ -370,14 +562,37 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         updates: list[dict],
         memory: StoryMemory,
         chapter: Chapter
-    ) -> None:
-        """Apply plot thread updates to memory."""
-        if not updates:
-            return
+    ) -> list[PlotThread]:
+        """
+        Apply plot thread updates to memory.
+
+        Takes all of a chapter's thread updates in one call. Duplicate
+        detection runs over the whole batch at once: the names of existing
+        threads and every introduced thread are normalized in a single
+        sweep before any update is applied. A heavier matcher (e.g. LLM or
+        embedding based) should keep this contract and resolve all
+        candidates with one request per batch, not one per update.
+
+        Returns:
+            Threads newly introduced by this chapter
+        """
+        new_threads = []
+        existing_by_name = {}  # Normalized name -> thread
 
         print(f"[UPDATER] Applying {len(updates)} thread update(s)...")
 
-        from ..models import PlotThread
+        # One normalization sweep over existing and introduced thread names
+        introduced_names = [
+            u.get("thread_name") for u in updates if u.get("action") == "introduce"
+        ]
+        if introduced_names:
+            existing_threads = list(memory.plot_threads.values())
+            normalized = _normalize_thread_names(
+                [t.name for t in existing_threads] + introduced_names
+            )
+            for thread, name in zip(existing_threads, normalized):
+                existing_by_name.setdefault(name, thread)
+            introduced_keys = iter(normalized[len(existing_threads):])
 
         for update_data in updates:
             action = update_data.get("action")
@@ -386,14 +601,8 @@ Be conservative - only report changes explicitly stated or strongly implied in t
 
             if action == "introduce":
                 # Check if thread already exists (fuzzy match to avoid duplicates)
-                normalized_new = self._normalize_thread_name(thread_name)
-                existing_thread = None
-
-                for thread in memory.plot_threads.values():
-                    normalized_existing = self._normalize_thread_name(thread.name)
-                    if normalized_existing == normalized_new:
-                        existing_thread = thread
-                        break
+                normalized_new = next(introduced_keys)
+                existing_thread = existing_by_name.get(normalized_new)
 
                 if existing_thread:
                     # Thread already exists, just update it
@@ -412,15 +621,12 @@ Be conservative - only report changes explicitly stated or strongly implied in t
                         status="open"
                     )
                     memory.plot_threads[thread_id] = new_thread
+                    existing_by_name.setdefault(normalized_new, new_thread)
+                    new_threads.append(new_thread)
                     print(f"         - New thread: '{thread_name}'")
 
             elif action == "progress":
-                # Find and update existing thread
-                thread = None
-                for t in memory.plot_threads.values():
-                    if t.name == thread_name:
-                        thread = t
-                        break
+                thread = memory.get_thread_by_name(thread_name)
 
                 if thread:
                     thread.status = "progressing"
@@ -433,12 +639,7 @@ Be conservative - only report changes explicitly stated or strongly implied in t
                     print(f"         - Warning: Thread '{thread_name}' not found")
 
             elif action == "resolve":
-                # Find and resolve thread
-                thread = None
-                for t in memory.plot_threads.values():
-                    if t.name == thread_name:
-                        thread = t
-                        break
+                thread = memory.get_thread_by_name(thread_name)
 
                 if thread:
                     thread.status = "resolved"
@@ -448,6 +649,8 @@ Be conservative - only report changes explicitly stated or strongly implied in t
                 else:
                     print(f"         - Warning: Thread '{thread_name}' not found")
 
+        return new_threads
+
     def _apply_relationships(
         self,
         relationships: list[dict],
@@ -455,32 +658,25 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         chapter: Chapter
     ) -> None:
         """Track character relationships."""
-        if not relationships:
-            return
-
         print(f"[UPDATER] Tracking {len(relationships)} relationship(s)...")
 
-        from ..models import Relationship
+        # Last character wins for duplicate names (relationships have always
+        # resolved that way, unlike the first-match get_character_by_name)
+        characters_by_name = {char.name: char for char in memory.characters.values()}
 
         for rel_data in relationships:
             char_a_name = rel_data.get("character_a")
             char_b_name = rel_data.get("character_b")
 
-            # Find character IDs by name
-            char_a_id = None
-            char_b_id = None
-            for char in memory.characters.values():
-                if char.name == char_a_name:
-                    char_a_id = char.character_id
-                if char.name == char_b_name:
-                    char_b_id = char.character_id
+            char_a = characters_by_name.get(char_a_name)
+            char_b = characters_by_name.get(char_b_name)
 
-            if not char_a_id or not char_b_id:
+            if not char_a or not char_b:
                 print(f"         - Warning: Could not find characters for relationship")
                 continue
 
             # Create relationship ID (sorted to avoid duplicates)
-            rel_key = tuple(sorted([char_a_id, char_b_id]))
+            rel_key = tuple(sorted([char_a.character_id, char_b.character_id]))
             rel_id = f"rel_{rel_key[0]}_{rel_key[1]}"
 
             # Check if relationship exists
@@ -491,8 +687,8 @@ Be conservative - only report changes explicitly stated or strongly implied in t
             else:
                 # Create new
                 new_rel = Relationship(
-                    character_a=char_a_id,
-                    character_b=char_b_id,
+                    character_a=char_a.character_id,
+                    character_b=char_b.character_id,
                     relationship_type=rel_data.get("type", "neutral"),
                     established_chapter=chapter.chapter_id,
                     last_updated=chapter.chapter_id,
@@ -508,13 +704,8 @@ Be conservative - only report changes explicitly stated or strongly implied in t
         chapter: Chapter
     ) -> None:
         """Add events to world timeline."""
-        if not events:
-            return
-
         print(f"[UPDATER] Adding {len(events)} event(s) to timeline...")
 
-        from ..models import WorldEvent
-
         for event_data in events:
             event_id = f"event_{chapter.chapter_id}_{len(memory.world_timeline) + 1}"
 
@@ -1,13 +1,27 @@
 """Utility functions and helpers."""
 
-from .config import get_settings, get_llm_config, get_style_guide, get_world_seed
-from .llm_client import LLMClient, create_client
+from .config import (
+    get_settings,
+    get_llm_config,
+    get_style_guide,
+    get_world_seed,
+    clear_config_caches,
+)
+from .llm_client import LLMClient, BatchUnavailableError, create_client
+from .json_utils import extract_json_block, parse_json_lenient
+from .text_utils import WordCounter, fast_word_count
 
 __all__ = [
     "get_settings",
     "get_llm_config",
     "get_style_guide",
     "get_world_seed",
+    "clear_config_caches",
     "LLMClient",
+    "BatchUnavailableError",
     "create_client",
+    "extract_json_block",
+    "parse_json_lenient",
+    "WordCounter",
+    "fast_word_count",
 ]
@@ -1,6 +1,7 @@
 """Configuration management."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,11 @@ import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment and config files."""
@@ -21,6 +27,10 @@ class Settings(BaseSettings):
     chapters_dir: Path = Field(default=Path("data/chapters"))
     memory_dir: Path = Field(default=Path("data/memory"))
     config_dir: Path = Field(default=Path("config"))
+    cache_dir: Path = Field(default=Path(".cache"))
+
+    # Reuse chapter drafts generated from an identical prompt (dev/replay aid)
+    draft_cache: bool = Field(default=False, alias="DRAFT_CACHE")
 
     # Debug
     debug: bool = Field(default=False, alias="DEBUG")
@@ -32,32 +42,59 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-def load_yaml_config(config_name: str, config_dir: Path = Path("config")) -> dict:
-    """Load a YAML configuration file."""
-    config_path = config_dir / f"{config_name}.yaml"
+def load_yaml_config(config_name: str, config_dir: Path | str = Path("config")) -> dict:
+    """
+    Load a YAML configuration file.
+
+    Results are cached per (config_name, config_dir); the returned dict is
+    shared between callers and must be treated as read-only.
+    """
+    return _load_yaml_config_cached(config_name, str(config_dir))
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_config_cached(config_name: str, config_dir: str) -> dict:
+    """Read and parse a YAML config file (cached, keyed by plain strings)."""
+    config_path = Path(config_dir) / f"{config_name}.yaml"
 
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Get application settings."""
     return Settings()
 
 
+@lru_cache(maxsize=None)
 def get_llm_config() -> dict:
     """Get LLM configuration."""
     return load_yaml_config("llm_config")
 
 
+@lru_cache(maxsize=None)
 def get_style_guide() -> dict:
     """Get style guide configuration."""
     return load_yaml_config("style_guide")
 
 
+@lru_cache(maxsize=None)
 def get_world_seed() -> dict:
     """Get world seed configuration."""
     return load_yaml_config("world_seed")
+
+
+def clear_config_caches() -> None:
+    """Drop all cached settings and YAML configs (e.g. after editing them in tests)."""
+    for loader in (
+        _load_yaml_config_cached,
+        get_settings,
+        get_llm_config,
+        get_style_guide,
+        get_world_seed,
+    ):
+        loader.cache_clear()
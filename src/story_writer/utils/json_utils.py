@@ -0,0 +1,155 @@
+"""Helpers for parsing JSON out of LLM responses."""
+
+import re
+from typing import Any
+
+import orjson
+
+try:
+    import json5
+except ImportError:  # Optional tolerant parser
+    json5 = None
+
+
+# Body of the first ``` / ```json fenced block
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
+# How many trailing commas to try cutting back to when repairing truncated output
+_MAX_REPAIR_CUTS = 10
+
+
+def extract_json_block(text: str) -> str:
+    """
+    Extract the JSON payload from an LLM response.
+
+    Strips a surrounding code fence if present, then any prose around the
+    outermost '{...}' / '[...]' span. A '[...]' that closes before the
+    object starts (e.g. "[updated]" in the prose) doesn't count. Unterminated
+    fences are tolerated; if nothing closes the opening bracket, the rest of
+    the text is returned for the repair pass.
+    """
+    match = _FENCE_RE.search(text)
+    if match:
+        text = match.group(1)
+    elif text.lstrip().startswith("```"):
+        # Opening fence without a closing one
+        text = text.lstrip()[3:].removeprefix("json")
+
+    spans = {}
+    for opener, closer in ("{}", "[]"):
+        start = text.find(opener)
+        if start != -1:
+            end = text.rfind(closer)
+            spans[opener] = (start, end if end > start else None)
+    if not spans:
+        return text.strip()
+
+    start, end = spans.get("{") or spans["["]
+    if "[" in spans and "{" in spans:
+        list_start, list_end = spans["["]
+        # Use the list only if it wraps the object (or is left open)
+        if list_start < start and (list_end is None or (end is not None and list_end > end)):
+            start, end = list_start, list_end
+
+    return text[start:end + 1] if end is not None else text[start:].rstrip()
+
+
+def parse_json_lenient(text: str) -> Any:
+    """
+    Parse JSON from an LLM response, recovering from common defects.
+
+    Tries, in order: strict parsing with orjson, json5 when
+    installed (trailing commas, comments, single quotes), then a repair pass
+    that drops trailing commas and closes strings/brackets left open by a
+    truncated response.
+
+    Raises:
+        json.JSONDecodeError: If no tier could parse the payload
+            (raised as its orjson subclass)
+    """
+    payload = extract_json_block(text)
+
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError as e:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        strict_error = e
+
+    if json5 is not None:
+        try:
+            data = json5.loads(payload)
+            print("[INFO] Parsed LLM JSON with json5 fallback")
+            return data
+        except ValueError:
+            pass
+
+    for candidate in _repair_candidates(payload):
+        try:
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            continue
+        print("[INFO] Parsed LLM JSON after repairing truncated output")
+        return data
+
+    raise strict_error
+
+
+def _repair_candidates(payload: str):
+    """
+    Yield repaired versions of a malformed/truncated JSON payload.
+
+    The first candidate closes everything left open at the end of the text;
+    later ones cut back to earlier top-level separators, dropping a trailing
+    element that was cut off mid-way (e.g. a dangling key).
+    """
+    out = []
+    stack = []
+    in_string = False
+    escaped = False
+    cut_points = []  # (len(out) before a ',', open-bracket stack at that point)
+
+    for ch in payload:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            _strip_trailing_comma(out)
+            if stack:
+                stack.pop()
+        elif ch == ",":
+            cut_points.append((len(out), list(stack)))
+        out.append(ch)
+
+    # Close whatever the truncated text left open
+    tail = list(out)
+    if in_string:
+        if escaped:
+            tail.pop()
+        tail.append('"')
+    _strip_trailing_comma(tail)
+    if "".join(tail).rstrip().endswith(":"):
+        tail.append(" null")
+    yield "".join(tail) + "".join(reversed(stack))
+
+    # Cut back to earlier separators, most recent first
+    for length, open_stack in reversed(cut_points[-_MAX_REPAIR_CUTS:]):
+        yield "".join(out[:length]) + "".join(reversed(open_stack))
+
+
+def _strip_trailing_comma(chars: list[str]) -> None:
+    """Remove trailing whitespace and a dangling comma from a char buffer."""
+    while chars and chars[-1].isspace():
+        chars.pop()
+    if chars and chars[-1] == ",":
+        chars.pop()
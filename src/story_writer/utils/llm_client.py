@@ -1,16 +1,132 @@
 """LLM client wrapper for multiple providers."""
 
+import asyncio
+import bisect
+import random
+import threading
 import time
-from typing import Optional, Literal
+from typing import Iterator, Optional, Literal
 
-from anthropic import Anthropic
-from openai import OpenAI
+import orjson
 
 from .config import get_settings, get_llm_config
 
 
 ProviderType = Literal["anthropic", "openai"]
 
+# Connection pool size for the shared HTTP clients
+_MAX_CONNECTIONS = 64
+
+# Retry backoff: full jitter over base * 2**attempt, capped (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# HTTP statuses worth retrying (timeouts, lock conflicts, rate limits, server errors)
+_RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+# Batch API job states that mean no more results are coming
+_OPENAI_BATCH_DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Sync HTTP clients shared by every LLMClient, keyed by (provider, timeout)
+_HTTP_CLIENTS: dict[tuple[str, float], object] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _build_http_client(provider: ProviderType, timeout: float, is_async: bool = False):
+    """
+    Build a pooled, keep-alive HTTP client for a provider SDK.
+
+    Uses HTTP/2 when the `h2` extra is installed. Returns None (SDK default
+    client) if httpx itself is unavailable.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    if provider == "anthropic":
+        from anthropic import DefaultHttpxClient, DefaultAsyncHttpxClient
+    else:
+        from openai import DefaultHttpxClient, DefaultAsyncHttpxClient
+    client_cls = DefaultAsyncHttpxClient if is_async else DefaultHttpxClient
+
+    return client_cls(
+        http2=http2,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=_MAX_CONNECTIONS,
+            max_keepalive_connections=_MAX_CONNECTIONS
+        )
+    )
+
+
+# Tokenizer encodings shared by every LLMClient, keyed by model name
+# (None when no tokenizer is available for that model)
+_ENCODINGS: dict[str, object] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+# Fallback encoding for models tiktoken doesn't know (e.g. Claude): not
+# exact for those, but far closer than a character-count heuristic
+_FALLBACK_ENCODING = "cl100k_base"
+
+
+def _get_encoding(model: str):
+    """Get the cached tiktoken encoding for a model, or None if unavailable."""
+    with _ENCODINGS_LOCK:
+        if model not in _ENCODINGS:
+            _ENCODINGS[model] = _load_encoding(model)
+        return _ENCODINGS[model]
+
+
+def _load_encoding(model: str):
+    """Load a tiktoken encoding, falling back to a generic one."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:  # Unknown model, or its BPE file failed to load
+        pass
+
+    try:
+        return tiktoken.get_encoding(_FALLBACK_ENCODING)
+    except Exception as e:  # e.g. BPE file download failed
+        print(f"[WARN] Tokenizer unavailable, using length-based estimate: {e}")
+        return None
+
+
+def get_shared_http_client(provider: ProviderType, timeout: float):
+    """Get the process-wide sync HTTP client for a provider (created on first use)."""
+    key = (provider, timeout)
+    with _HTTP_CLIENTS_LOCK:
+        if key not in _HTTP_CLIENTS:
+            _HTTP_CLIENTS[key] = _build_http_client(provider, timeout)
+        return _HTTP_CLIENTS[key]
+
+
+class BatchUnavailableError(RuntimeError):
+    """The provider's batch API could not accept a batch request."""
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Parse a Retry-After / retry-after-ms header into seconds, if present."""
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass  # HTTP-date form; fall back to backoff
+    return None
+
 
 class LLMClient:
     """Unified interface for LLM providers."""
@@ -32,15 +148,22 @@ class LLMClient:
 
         # Determine provider
         self.provider = provider or self.llm_config.get("provider", "anthropic")
+        self.timeout = self.llm_config["generation"]["timeout"]
 
-        # Initialize client based on provider
+        # Initialize client based on provider (SDKs are imported lazily so
+        # only the configured one is loaded)
         if self.provider == "anthropic":
             if not self.settings.anthropic_api_key:
                 raise ValueError(
                     "ANTHROPIC_API_KEY not found. "
                     "Please set it in .env file or environment."
                 )
-            self.client = Anthropic(api_key=self.settings.anthropic_api_key)
+            from anthropic import Anthropic
+            self.client = Anthropic(
+                api_key=self.settings.anthropic_api_key,
+                http_client=get_shared_http_client(self.provider, self.timeout),
+                max_retries=0  # Retries are handled by this class
+            )
             self.model = model or self.llm_config["anthropic"]["model"]
             self.default_max_tokens = self.llm_config["anthropic"]["max_tokens"]
             self.default_temperature = self.llm_config["anthropic"]["temperature"]
@@ -51,7 +174,12 @@ class LLMClient:
                     "OPENAI_API_KEY not found. "
                     "Please set it in .env file or environment."
                 )
-            self.client = OpenAI(api_key=self.settings.openai_api_key)
+            from openai import OpenAI
+            self.client = OpenAI(
+                api_key=self.settings.openai_api_key,
+                http_client=get_shared_http_client(self.provider, self.timeout),
+                max_retries=0  # Retries are handled by this class
+            )
             self.model = model or self.llm_config["openai"]["model"]
             self.default_max_tokens = self.llm_config["openai"]["max_tokens"]
             self.default_temperature = self.llm_config["openai"]["temperature"]
@@ -61,7 +189,16 @@ class LLMClient:
 
         # Generation settings
         self.max_retries = self.llm_config["generation"]["max_retries"]
-        self.timeout = self.llm_config["generation"]["timeout"]
+        self.retry_budget = self.llm_config["generation"].get("retry_budget", self.timeout)
+        self.max_concurrency = self.llm_config["generation"].get("max_concurrency", 4)
+        self.length_bins = sorted(self.llm_config["generation"].get("bins", []))
+        self.batch_poll_interval = self.llm_config["generation"].get("batch_poll_interval", 30)
+        self.batch_timeout = self.llm_config["generation"].get("batch_timeout", 3600)
+
+        # Async client is created lazily and bound to the running event loop;
+        # it stays open until aclose() (or leaving `async with client:`)
+        self._async_client = None
+        self._async_loop = None
 
     def generate(
         self,
@@ -84,6 +221,7 @@ class LLMClient:
         """
         temperature = temperature or self.default_temperature
         max_tokens = max_tokens or self.default_max_tokens
+        deadline = time.monotonic() + self.retry_budget
 
         for attempt in range(self.max_retries):
             try:
@@ -96,21 +234,356 @@ class LLMClient:
                         prompt, system_prompt, temperature, max_tokens
                     )
             except Exception as e:
-                if attempt == self.max_retries - 1:
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
                     raise
                 print(f"Retry {attempt + 1}/{self.max_retries} after error: {e}")
-                time.sleep(2 ** attempt)  # Exponential backoff
+                time.sleep(delay)
 
         raise RuntimeError("Max retries exceeded")
 
-    def _generate_anthropic(
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Generate text from prompt, yielding chunks as they arrive.
+
+        Failures before the first chunk are retried like `generate`; once
+        text has been yielded, errors propagate to the caller since the
+        partial output can't be taken back.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+
+        Yields:
+            Generated text chunks
+        """
+        temperature = temperature or self.default_temperature
+        max_tokens = max_tokens or self.default_max_tokens
+        deadline = time.monotonic() + self.retry_budget
+
+        for attempt in range(self.max_retries):
+            started = False
+            try:
+                if self.provider == "anthropic":
+                    chunks = self._stream_anthropic(
+                        prompt, system_prompt, temperature, max_tokens
+                    )
+                else:
+                    chunks = self._stream_openai(
+                        prompt, system_prompt, temperature, max_tokens
+                    )
+                for chunk in chunks:
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                delay = None if started else self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+                print(f"Retry {attempt + 1}/{self.max_retries} after error: {e}")
+                time.sleep(delay)
+
+        raise RuntimeError("Max retries exceeded")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate text from prompt without blocking the event loop.
+
+        The async client stays open for later calls on the same loop; close
+        it with `aclose()` (or `async with client:`) when the loop is done.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+
+        Returns:
+            Generated text
+        """
+        temperature = temperature or self.default_temperature
+        max_tokens = max_tokens or self.default_max_tokens
+        client = self._get_async_client()
+        deadline = time.monotonic() + self.retry_budget
+
+        for attempt in range(self.max_retries):
+            try:
+                if self.provider == "anthropic":
+                    response = await client.messages.create(
+                        **self._anthropic_kwargs(prompt, system_prompt, temperature, max_tokens)
+                    )
+                    return response.content[0].text
+                elif self.provider == "openai":
+                    response = await client.chat.completions.create(
+                        **self._openai_kwargs(prompt, system_prompt, temperature, max_tokens)
+                    )
+                    return response.choices[0].message.content
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+                print(f"Retry {attempt + 1}/{self.max_retries} after error: {e}")
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("Max retries exceeded")
+
+    async def agenerate_many(
+        self,
+        prompts: list[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        length_estimates: Optional[list[int]] = None,
+    ) -> list[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        At most `max_concurrency` requests are in flight at once. When
+        `length_estimates` are given, prompts are grouped into the length
+        buckets from `generation.bins` and each bucket is gathered in turn,
+        so short requests are not held up waiting on the longest one.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System prompt shared by all requests (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate per request (optional)
+            length_estimates: Expected output tokens per prompt (optional)
+
+        Returns:
+            Generated texts, in the same order as `prompts`
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, system_prompt, temperature, max_tokens)
+
+        if length_estimates is None:
+            return await asyncio.gather(*(run(p) for p in prompts))
+
+        results = [None] * len(prompts)
+        for bucket in self.bucket_by_length(length_estimates):
+            texts = await asyncio.gather(*(run(prompts[i]) for i in bucket))
+            for i, text in zip(bucket, texts):
+                results[i] = text
+
+        return results
+
+    async def __aenter__(self) -> "LLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the async client bound to the running event loop, if any.
+
+        The async methods never close it themselves, since other tasks on the
+        loop may still be using it; whoever owns the loop does, e.g. with
+        `async with client:` around the work passed to asyncio.run().
+        """
+        if self._async_client is None or self._async_loop is not asyncio.get_running_loop():
+            return
+
+        client, self._async_client, self._async_loop = self._async_client, None, None
+        await client.close()
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Generate responses for several prompts with the provider's batch API.
+
+        Submits every prompt as one batch job (Anthropic Message Batches or
+        OpenAI Batch API) and polls until it finishes. Batches run at lower
+        cost but may take minutes, so only use this for work that can wait.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System prompt shared by all requests (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate per request (optional)
+
+        Returns:
+            Generated texts, in the same order as `prompts`
+
+        Requests that fail inside the batch are re-run one by one with
+        `generate()`, keeping every result the batch did return.
+
+        Raises:
+            BatchUnavailableError: If the batch job could not be submitted
+            TimeoutError: If the batch didn't finish within `batch_timeout`
+        """
+        temperature = temperature or self.default_temperature
+        max_tokens = max_tokens or self.default_max_tokens
+
+        if self.provider == "anthropic":
+            requests = [
+                {
+                    "custom_id": f"req-{i}",
+                    "params": self._anthropic_kwargs(prompt, system_prompt, temperature, max_tokens)
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+            submit, poll, collect = (
+                self._submit_batch_anthropic, self._poll_batch_anthropic, self._collect_batch_anthropic
+            )
+        else:
+            requests = [
+                {
+                    "custom_id": f"req-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._openai_kwargs(prompt, system_prompt, temperature, max_tokens)
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+            submit, poll, collect = (
+                self._submit_batch_openai, self._poll_batch_openai, self._collect_batch_openai
+            )
+
+        try:
+            batch_id = submit(requests)
+        except Exception as e:
+            raise BatchUnavailableError(f"Batch submission failed: {e}") from e
+
+        print(f"[INFO] Submitted batch {batch_id} ({len(prompts)} request(s))")
+
+        deadline = time.monotonic() + self.batch_timeout
+        while not poll(batch_id):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Batch {batch_id} did not finish in {self.batch_timeout}s")
+            time.sleep(self.batch_poll_interval)
+
+        texts = collect(batch_id)
+        results = [texts.get(f"req-{i}") for i in range(len(prompts))]
+        failed = [i for i, text in enumerate(results) if text is None]
+        if failed:
+            print(f"[WARN] Batch {batch_id}: {len(failed)} request(s) failed, retrying them directly")
+            for i in failed:
+                results[i] = self.generate(prompts[i], system_prompt, temperature, max_tokens)
+
+        return results
+
+    def bucket_by_length(self, lengths: list[int]) -> list[list[int]]:
+        """
+        Group item indices into the configured length buckets.
+
+        Args:
+            lengths: Estimated length (tokens) of each item
+
+        Returns:
+            Non-empty buckets of indices, shortest bucket first
+        """
+        buckets = [[] for _ in range(len(self.length_bins) + 1)]
+        for i, length in enumerate(lengths):
+            buckets[bisect.bisect_right(self.length_bins, length)].append(i)
+        return [bucket for bucket in buckets if bucket]
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Whether a request error is transient (worth trying again).
+
+        Connection errors, timeouts, rate limits and server errors are;
+        auth and validation errors are not.
+        """
+        if self.provider == "anthropic":
+            from anthropic import APIConnectionError, APIStatusError
+        else:
+            from openai import APIConnectionError, APIStatusError
+
+        if isinstance(error, APIStatusError):
+            return error.status_code in _RETRYABLE_STATUSES or error.status_code >= 500
+        return isinstance(error, APIConnectionError)  # Includes timeouts
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: float) -> Optional[float]:
+        """
+        Decide whether a failed request should be retried.
+
+        Only connection errors, timeouts, rate limits and server errors are
+        retried; auth and validation errors fail immediately. Waits honor the
+        server's Retry-After header, otherwise use exponential backoff with
+        full jitter so concurrent callers don't retry in lockstep.
+
+        Args:
+            error: Exception raised by the request
+            attempt: Zero-based attempt number that failed
+            deadline: time.monotonic() value after which no retry starts
+
+        Returns:
+            Seconds to wait before retrying, or None to re-raise
+        """
+        if attempt >= self.max_retries - 1 or not self.is_retryable(error):
+            return None
+
+        delay = None
+        if getattr(error, "response", None) is not None:
+            delay = _retry_after_seconds(error.response.headers)
+
+        if delay is None:
+            delay = random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+
+        if time.monotonic() + delay > deadline:
+            return None
+
+        return delay
+
+    def _get_async_client(self):
+        """Get the async SDK client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = self._create_async_client()
+            self._async_loop = loop
+        return self._async_client
+
+    def _create_async_client(self):
+        """Create an async SDK client with its own connection pool."""
+        # Async connections belong to one event loop, so the pool is
+        # per client and per loop rather than process-wide
+        http_client = _build_http_client(self.provider, self.timeout, is_async=True)
+        if self.provider == "anthropic":
+            from anthropic import AsyncAnthropic
+            return AsyncAnthropic(
+                api_key=self.settings.anthropic_api_key,
+                http_client=http_client,
+                max_retries=0
+            )
+
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(
+            api_key=self.settings.openai_api_key,
+            http_client=http_client,
+            max_retries=0
+        )
+
+    def _anthropic_kwargs(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
         max_tokens: int
-    ) -> str:
-        """Generate using Anthropic Claude."""
+    ) -> dict:
+        """Build request arguments for Anthropic Claude."""
         kwargs = {
             "model": self.model,
             "max_tokens": max_tokens,
@@ -119,19 +592,24 @@ class LLMClient:
         }
 
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Mark the system prompt as a cacheable prefix so repeated calls
+            # with the same instructions reuse the server-side prompt cache
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
 
-        response = self.client.messages.create(**kwargs)
-        return response.content[0].text
+        return kwargs
 
-    def _generate_openai(
+    def _openai_kwargs(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
         max_tokens: int
-    ) -> str:
-        """Generate using OpenAI GPT."""
+    ) -> dict:
+        """Build request arguments for OpenAI GPT."""
         messages = []
 
         if system_prompt:
@@ -139,22 +617,132 @@ class LLMClient:
 
         messages.append({"role": "user", "content": prompt})
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+
+    def _generate_anthropic(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Generate using Anthropic Claude."""
+        response = self.client.messages.create(
+            **self._anthropic_kwargs(prompt, system_prompt, temperature, max_tokens)
         )
+        return response.content[0].text
 
+    def _generate_openai(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Generate using OpenAI GPT."""
+        response = self.client.chat.completions.create(
+            **self._openai_kwargs(prompt, system_prompt, temperature, max_tokens)
+        )
         return response.choices[0].message.content
 
-    def count_tokens_estimate(self, text: str) -> int:
+    def _stream_anthropic(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Iterator[str]:
+        """Stream text chunks from Anthropic Claude."""
+        with self.client.messages.stream(
+            **self._anthropic_kwargs(prompt, system_prompt, temperature, max_tokens)
+        ) as stream:
+            yield from stream.text_stream
+
+    def _stream_openai(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Iterator[str]:
+        """Stream text chunks from OpenAI GPT."""
+        response = self.client.chat.completions.create(
+            **self._openai_kwargs(prompt, system_prompt, temperature, max_tokens),
+            stream=True
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _submit_batch_anthropic(self, requests: list[dict]) -> str:
+        """Create an Anthropic message batch and return its ID."""
+        return self.client.messages.batches.create(requests=requests).id
+
+    def _poll_batch_anthropic(self, batch_id: str) -> bool:
+        """Check whether an Anthropic message batch has ended."""
+        return self.client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def _collect_batch_anthropic(self, batch_id: str) -> dict[str, str]:
+        """Read succeeded results of an Anthropic message batch, by custom ID."""
+        return {
+            entry.custom_id: entry.result.message.content[0].text
+            for entry in self.client.messages.batches.results(batch_id)
+            if entry.result.type == "succeeded"
+        }
+
+    def _submit_batch_openai(self, requests: list[dict]) -> str:
+        """Upload a JSONL request file, create an OpenAI batch and return its ID."""
+        jsonl = b"\n".join(orjson.dumps(request) for request in requests)
+        input_file = self.client.files.create(
+            file=("batch_requests.jsonl", jsonl),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def _poll_batch_openai(self, batch_id: str) -> bool:
+        """Check whether an OpenAI batch has reached a final state."""
+        return self.client.batches.retrieve(batch_id).status in _OPENAI_BATCH_DONE
+
+    def _collect_batch_openai(self, batch_id: str) -> dict[str, str]:
+        """Read succeeded results of an OpenAI batch, by custom ID."""
+        batch = self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return {}
+
+        texts = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = orjson.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                texts[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return texts
+
+    def count_tokens(self, text: str) -> int:
         """
-        Rough estimate of token count.
-        For accurate counts, use tiktoken (OpenAI) or anthropic tokenizer.
+        Count tokens in text with the model's tokenizer.
+
+        Uses tiktoken (exact for OpenAI models, close for others). Falls back
+        to a ~4 characters per token estimate when tiktoken is unavailable.
         """
-        # Rough approximation: 1 token ≈ 4 characters
-        return len(text) // 4
+        encoding = _get_encoding(self.model)
+        if encoding is None:
+            return len(text) // 4
+        return len(encoding.encode(text, disallowed_special=()))
+
+    # Kept for existing callers
+    count_tokens_estimate = count_tokens
 
 
 def create_client(
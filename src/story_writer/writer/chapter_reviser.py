@@ -1,8 +1,41 @@
 """Chapter revision system for quality improvement."""
 
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping
 from ..models import Chapter, ContinuityViolation, QualityReport, RevisionResult
-from ..utils import LLMClient, get_style_guide
+from ..utils import LLMClient, get_style_guide, fast_word_count
+
+
+# Violation severities that revisions must address
+_MAJOR_SEVERITIES = frozenset({"critical", "major"})
+
+
+@lru_cache(maxsize=128)
+def _feedback_summary(
+    issues: tuple[tuple[str, str, str], ...],
+    suggestions: tuple[str, ...],
+    strengths: tuple[str, ...]
+) -> Mapping:
+    """
+    Build the structured feedback mapping.
+
+    The result is cached and shared between calls, so it is read-only: a
+    mapping proxy over tuples.
+
+    Args:
+        issues: (type, description, suggested_fix) of each major violation
+        suggestions: Quality suggestions to include
+        strengths: Strengths to preserve
+    """
+    return MappingProxyType({
+        "continuity_issues": tuple(
+            MappingProxyType({"type": v_type, "issue": description, "fix": fix})
+            for v_type, description, fix in issues
+        ),
+        "quality_suggestions": suggestions,
+        "preserve_strengths": strengths
+    })
 
 
 class ChapterReviser:
@@ -22,6 +55,10 @@ class ChapterReviser:
         self.client = llm_client
         self.style_guide = get_style_guide()
 
+        # The system prompt only depends on the style guide, so build it once;
+        # sending the identical string every call keeps provider prefix caches warm
+        self._system_prompt = self._create_system_prompt()
+
     def revise_chapter(
         self,
         chapter: Chapter,
@@ -45,31 +82,89 @@ class ChapterReviser:
         """
         print(f"\n[REVISER] Revising chapter {chapter.chapter_number} (attempt {attempt})...")
 
-        # Build revision context
-        feedback = self._build_feedback_summary(violations, quality_report)
-
-        # Generate revised chapter
-        prompt = self._create_revision_prompt(chapter, chapter_text, feedback)
-        system_prompt = self._create_system_prompt()
+        # Build revision context and prompt
+        prompt = self._prepare_revision(chapter, chapter_text, violations, quality_report)
 
         print(f"[REVISER] Generating revised version...")
         revised_text = self.client.generate(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=self._system_prompt,
             temperature=0.75  # Slightly creative but focused
         )
 
+        return self._build_result(revised_text, violations, quality_report, attempt)
+
+    async def revise_chapters(self, revisions: List[dict]) -> List[RevisionResult]:
+        """
+        Revise several chapters concurrently.
+
+        Requests are bucketed by chapter length (see `LLMClient.agenerate_many`).
+
+        Args:
+            revisions: One dict per chapter with the keyword arguments of
+                `revise_chapter` (chapter, chapter_text, violations,
+                quality_report and optionally attempt)
+
+        Returns:
+            RevisionResults, in the same order as `revisions`
+        """
+        print(f"\n[REVISER] Revising {len(revisions)} chapter(s)...")
+
+        prompts = [
+            self._prepare_revision(
+                r["chapter"], r["chapter_text"], r["violations"], r["quality_report"]
+            )
+            for r in revisions
+        ]
+
+        revised_texts = await self.client.agenerate_many(
+            prompts,
+            system_prompt=self._system_prompt,
+            temperature=0.75,  # Slightly creative but focused
+            # A revision is roughly as long as the chapter it rewrites
+            length_estimates=[
+                self.client.count_tokens_estimate(r["chapter_text"]) for r in revisions
+            ]
+        )
+
+        return [
+            self._build_result(
+                text, r["violations"], r["quality_report"], r.get("attempt", 1)
+            )
+            for text, r in zip(revised_texts, revisions)
+        ]
+
+    def _prepare_revision(
+        self,
+        chapter: Chapter,
+        chapter_text: str,
+        violations: List[ContinuityViolation],
+        quality_report: QualityReport
+    ) -> str:
+        """Build the revision prompt for a chapter."""
+        feedback = self._build_feedback_summary(violations, quality_report)
+        return self._create_revision_prompt(chapter, chapter_text, feedback)
+
+    def _build_result(
+        self,
+        revised_text: str,
+        violations: List[ContinuityViolation],
+        quality_report: QualityReport,
+        attempt: int
+    ) -> RevisionResult:
+        """Package revised text and notes into a RevisionResult."""
         # Create revision notes
         notes = self._create_revision_notes(violations, quality_report, attempt)
 
         # Determine what was fixed
         violations_fixed = [
             v.description for v in violations
-            if v.severity in ["critical", "major"]
+            if v.severity in _MAJOR_SEVERITIES
         ]
 
         result = RevisionResult(
             revised_text=revised_text,
+            word_count=fast_word_count(revised_text),
             revision_notes=notes,
             violations_fixed=violations_fixed,
             quality_improved=True  # Assume improvement; will be verified
@@ -85,24 +180,22 @@ class ChapterReviser:
         self,
         violations: List[ContinuityViolation],
         quality_report: QualityReport
-    ) -> dict:
-        """Build structured feedback for revision."""
-        feedback = {
-            "continuity_issues": [],
-            "quality_suggestions": quality_report.suggestions[:3],
-            "preserve_strengths": quality_report.strengths[:2]
-        }
+    ) -> Mapping:
+        """
+        Build structured feedback for revision (read-only).
 
+        Repeated attempts on the same feedback reuse the cached summary.
+        """
         # Focus on critical and major violations
-        for v in violations:
-            if v.severity in ["critical", "major"]:
-                feedback["continuity_issues"].append({
-                    "type": v.type,
-                    "issue": v.description,
-                    "fix": v.suggested_fix
-                })
-
-        return feedback
+        return _feedback_summary(
+            tuple(
+                (v.type, v.description, v.suggested_fix)
+                for v in violations
+                if v.severity in _MAJOR_SEVERITIES
+            ),
+            tuple(quality_report.suggestions[:3]),
+            tuple(quality_report.strengths[:2])
+        )
 
     def _create_system_prompt(self) -> str:
         """Create system prompt for revision."""
@@ -126,10 +219,10 @@ Return the complete revised chapter text."""
         self,
         chapter: Chapter,
         chapter_text: str,
-        feedback: dict
+        feedback: Mapping
     ) -> str:
         """Create the revision prompt."""
-        prompt = f"""Revise this manga chapter based on specific feedback.
+        parts = [f"""Revise this manga chapter based on specific feedback.
 
 CHAPTER INFO:
 Title: {chapter.title}
@@ -142,30 +235,32 @@ ORIGINAL TEXT:
 
 REVISION REQUIREMENTS:
 
-"""
+"""]
 
         # Add continuity issues if any
         if feedback["continuity_issues"]:
-            prompt += "**CONTINUITY ISSUES TO FIX:**\n"
-            for i, issue in enumerate(feedback["continuity_issues"], 1):
-                prompt += f"{i}. {issue['issue']}\n"
-                prompt += f"   Fix: {issue['fix']}\n\n"
+            parts.append("**CONTINUITY ISSUES TO FIX:**\n")
+            parts.extend(
+                f"{i}. {issue['issue']}\n   Fix: {issue['fix']}\n\n"
+                for i, issue in enumerate(feedback["continuity_issues"], 1)
+            )
 
         # Add quality suggestions
         if feedback["quality_suggestions"]:
-            prompt += "**QUALITY IMPROVEMENTS:**\n"
-            for i, suggestion in enumerate(feedback["quality_suggestions"], 1):
-                prompt += f"{i}. {suggestion}\n"
-            prompt += "\n"
+            parts.append("**QUALITY IMPROVEMENTS:**\n")
+            parts.extend(
+                f"{i}. {suggestion}\n"
+                for i, suggestion in enumerate(feedback["quality_suggestions"], 1)
+            )
+            parts.append("\n")
 
         # Note strengths to preserve
         if feedback["preserve_strengths"]:
-            prompt += "**PRESERVE THESE STRENGTHS:**\n"
-            for strength in feedback["preserve_strengths"]:
-                prompt += f"- {strength}\n"
-            prompt += "\n"
+            parts.append("**PRESERVE THESE STRENGTHS:**\n")
+            parts.extend(f"- {strength}\n" for strength in feedback["preserve_strengths"])
+            parts.append("\n")
 
-        prompt += """**GUIDELINES:**
+        parts.append("""**GUIDELINES:**
 - Make TARGETED fixes, not a complete rewrite
 - Keep the core plot, characters, and story progression
 - Maintain Oda-style elements: optimism, mystery, adventure
@@ -173,9 +268,9 @@ REVISION REQUIREMENTS:
 - Preserve the cliffhanger ending
 - Keep the chapter length similar (1200-1800 words)
 
-Return the complete revised chapter in the same markdown format as the original."""
+Return the complete revised chapter in the same markdown format as the original.""")
 
-        return prompt
+        return "".join(parts)
 
     def _create_revision_notes(
         self,
@@ -184,21 +279,22 @@ Return the complete revised chapter in the same markdown format as the original.
         attempt: int
     ) -> str:
         """Create human-readable revision notes."""
-        notes = f"Revision Attempt {attempt}\n\n"
+        parts = [f"Revision Attempt {attempt}\n\n"]
 
         if violations:
-            notes += f"Continuity fixes ({len(violations)}):\n"
-            for v in violations:
-                if v.severity in ["critical", "major"]:
-                    notes += f"  - [{v.severity.upper()}] {v.description}\n"
-            notes += "\n"
+            parts.append(f"Continuity fixes ({len(violations)}):\n")
+            parts.extend(
+                f"  - [{v.severity.upper()}] {v.description}\n"
+                for v in violations
+                if v.severity in _MAJOR_SEVERITIES
+            )
+            parts.append("\n")
 
         if quality_report.suggestions:
-            notes += f"Quality improvements:\n"
-            for suggestion in quality_report.suggestions[:3]:
-                notes += f"  - {suggestion}\n"
-            notes += "\n"
+            parts.append(f"Quality improvements:\n")
+            parts.extend(f"  - {suggestion}\n" for suggestion in quality_report.suggestions[:3])
+            parts.append("\n")
 
-        notes += f"Original quality score: {quality_report.overall_score}/100\n"
+        parts.append(f"Original quality score: {quality_report.overall_score}/100\n")
 
-        return notes
+        return "".join(parts)
@@ -1,23 +1,109 @@
 """Chapter writing using LLM."""
 
+import asyncio
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+import orjson
 
 from ..models import StoryMemory, ChapterOutline, Chapter
-from ..utils import LLMClient, get_style_guide
+from ..utils import (
+    LLMClient,
+    BatchUnavailableError,
+    get_settings,
+    get_style_guide,
+    WordCounter,
+    fast_word_count,
+)
+
+
+_CHAPTER_ID_FMT = "ch_{:03d}".format
+
+# Drafts kept in the on-disk cache; the oldest are pruned beyond this
+_MAX_CACHED_DRAFTS = 200
+
+
+@lru_cache(maxsize=512)
+def _render_character_card(
+    name: str,
+    personality: str,
+    speech_pattern: str,
+    quirks: tuple[str, ...]
+) -> str:
+    """Render a character's CHARACTER DETAILS entry (cached: main characters recur every chapter)."""
+    parts = [f"- {name}: {personality}\n"]
+    if speech_pattern:
+        parts.append(f"  Speech: {speech_pattern}\n")
+    if quirks:
+        parts.append(f"  Quirks: {', '.join(quirks)}\n")
+    return "".join(parts)
+
+
+def _in_event_loop() -> bool:
+    """Whether the caller is running inside an event loop (asyncio.run would fail)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class SceneDigest(NamedTuple):
+    """Everything derived from an outline's scenes, built in one pass."""
+    characters: list[str]
+    locations: list[str]
+    prompt_fragment: str  # "SCENE STRUCTURE" prompt section
+
+
+# Static instructions that open every writing prompt; keeping them ahead of
+# the per-chapter sections gives consecutive requests a byte-identical prefix
+_WRITING_PROMPT_HEADER = """You will write one full manga chapter from the outline below.
+Make it vivid, emotional, and engaging.
+Show don't tell. Use dialogue to reveal character.
+Create visual moments that would work as manga panels.
+
+---
+
+"""
 
 
 class ChapterWriter:
     """Writes full chapters from outlines using LLM."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        retriever=None,
+        use_draft_cache: bool | None = None
+    ):
         """
         Initialize chapter writer.
 
         Args:
             llm_client: LLM client for generation
+            retriever: Optional SmartRetriever for relevant past events
+            use_draft_cache: Reuse drafts previously generated from an
+                identical prompt instead of calling the LLM again
+                (default: the DRAFT_CACHE setting, off unless enabled)
         """
         self.client = llm_client
+        self.retriever = retriever
+        settings = get_settings()
+        if use_draft_cache is None:
+            use_draft_cache = settings.draft_cache
+        self.draft_cache_dir = (
+            settings.cache_dir / "chapter_drafts" if use_draft_cache else None
+        )
         self.style_guide = get_style_guide()
+        self._chapter_structure = self.style_guide["chapter"]
+        self._target_wc = self._chapter_structure["target_word_count"]
+
+        # The system prompt only depends on the style guide, so build it once;
+        # sending the identical string every call keeps provider prefix caches warm
+        self._system_prompt = self._create_system_prompt()
 
     def write_chapter(
         self,
@@ -36,33 +122,290 @@ class ChapterWriter:
         """
         print(f"\n[WRITER] Writing Chapter {outline.chapter_number}: {outline.title}")
 
-        # Build context
-        context = self._build_writing_context(memory, outline)
+        prompt, digest = self._prepare_chapter(outline, memory)
 
-        # Generate chapter text
-        prompt = self._create_writing_prompt(outline, context)
-        system_prompt = self._create_system_prompt()
+        cached = self._load_draft(prompt)
+        if cached is not None:
+            return self._build_chapter(outline, digest, cached)
 
         print(f"[WRITER] Generating chapter text with LLM...")
         print(f"         (Target: {outline.expected_word_count} words)")
 
-        content = self.client.generate(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=0.9,  # More creative for writing
-            max_tokens=4096
+        # Stream the text, counting words as chunks arrive
+        chunks = []
+        words = WordCounter()
+        try:
+            for chunk in self.client.stream(
+                prompt=prompt,
+                system_prompt=self._system_prompt,
+                temperature=0.9,  # More creative for writing
+                max_tokens=4096
+            ):
+                chunks.append(chunk)
+                words.feed(chunk)
+        except Exception as e:
+            if not self.client.is_retryable(e):
+                raise
+            # A dropped stream can't be resumed; regenerate the chapter once
+            print(f"[WARN] Stream interrupted after {words.count} words ({e}), retrying...")
+            content = self.client.generate(
+                prompt=prompt,
+                system_prompt=self._system_prompt,
+                temperature=0.9,
+                max_tokens=4096
+            )
+            self._save_draft(prompt, content)
+            return self._build_chapter(outline, digest, content)
+
+        content = "".join(chunks)
+        self._save_draft(prompt, content)
+
+        return self._build_chapter(outline, digest, content, words.count)
+
+    async def awrite_chapter(
+        self,
+        outline: ChapterOutline,
+        memory: StoryMemory
+    ) -> Chapter:
+        """
+        Write a full chapter from an outline without blocking the event loop.
+
+        Args:
+            outline: Chapter outline to expand
+            memory: Current story memory for context
+
+        Returns:
+            Complete Chapter with full text
+        """
+        print(f"\n[WRITER] Writing Chapter {outline.chapter_number}: {outline.title}")
+
+        prompt, digest = self._prepare_chapter(outline, memory)
+
+        content = self._load_draft(prompt)
+        if content is None:
+            content = await self.client.agenerate(
+                prompt=prompt,
+                system_prompt=self._system_prompt,
+                temperature=0.9,  # More creative for writing
+                max_tokens=4096
+            )
+            self._save_draft(prompt, content)
+
+        return self._build_chapter(outline, digest, content)
+
+    async def awrite_chapters(
+        self,
+        outlines: list[ChapterOutline],
+        memory: StoryMemory
+    ) -> list[Chapter]:
+        """
+        Write several independent chapters concurrently.
+
+        Only use for chapters that don't build on each other's text (e.g.
+        side-arc drafts or alternative takes): every prompt is built from the
+        same `memory`. At most `max_concurrency` requests run at once.
+
+        Args:
+            outlines: Chapter outlines to expand
+            memory: Current story memory for context
+
+        Returns:
+            Complete Chapters, in the same order as `outlines`
+        """
+        print(f"\n[WRITER] Writing {len(outlines)} chapter(s) concurrently...")
+
+        prepared = [self._prepare_chapter(outline, memory) for outline in outlines]
+        contents, missing = self._load_drafts(prepared)
+
+        if missing:
+            generated = await self.client.agenerate_many(
+                [prepared[i][0] for i in missing],
+                system_prompt=self._system_prompt,
+                temperature=0.9,  # More creative for writing
+                max_tokens=4096
+            )
+            self._fill_drafts(prepared, contents, missing, generated)
+
+        # One timestamp for the whole batch
+        created_at = datetime.now()
+        return [
+            self._build_chapter(outline, digest, content, created_at=created_at)
+            for outline, (_, digest), content in zip(outlines, prepared, contents)
+        ]
+
+    def write_chapters(
+        self,
+        outlines: list[ChapterOutline],
+        memory: StoryMemory
+    ) -> list[Chapter]:
+        """
+        Write several independent chapters in one provider batch job.
+
+        Same caveat as `awrite_chapters`: every prompt is built from the same
+        `memory`. Falls back to concurrent requests if the provider's batch
+        API can't take the job.
+
+        Args:
+            outlines: Chapter outlines to expand
+            memory: Current story memory for context
+
+        Returns:
+            Complete Chapters, in the same order as `outlines`
+        """
+        print(f"\n[WRITER] Writing {len(outlines)} chapter(s) as a batch...")
+
+        prepared = [self._prepare_chapter(outline, memory) for outline in outlines]
+        contents, missing = self._load_drafts(prepared)
+
+        if missing:
+            prompts = [prepared[i][0] for i in missing]
+            try:
+                generated = self.client.generate_batch(
+                    prompts,
+                    system_prompt=self._system_prompt,
+                    temperature=0.9,  # More creative for writing
+                    max_tokens=4096
+                )
+            except BatchUnavailableError as e:
+                if _in_event_loop():
+                    raise RuntimeError(
+                        f"{e}; use awrite_chapters() when calling from async code"
+                    ) from e
+                print(f"[WARN] {e} - writing chapters concurrently instead")
+                generated = asyncio.run(self._agenerate_and_close(prompts))
+            self._fill_drafts(prepared, contents, missing, generated)
+
+        # One timestamp for the whole batch
+        created_at = datetime.now()
+        return [
+            self._build_chapter(outline, digest, content, created_at=created_at)
+            for outline, (_, digest), content in zip(outlines, prepared, contents)
+        ]
+
+    async def _agenerate_and_close(self, prompts: list[str]) -> list[str]:
+        """Write drafts concurrently on a private event loop, then close its client."""
+        async with self.client:
+            return await self.client.agenerate_many(
+                prompts,
+                system_prompt=self._system_prompt,
+                temperature=0.9,
+                max_tokens=4096
+            )
+
+    def _draft_path(self, prompt: str) -> Path:
+        """Cache file for the draft generated from a prompt."""
+        key = hashlib.sha256(orjson.dumps({
+            "model": self.client.model,
+            "system": self._system_prompt,
+            "prompt": prompt
+        })).hexdigest()
+        return self.draft_cache_dir / f"{key}.txt"
+
+    def _load_draft(self, prompt: str) -> str | None:
+        """Get a cached draft for an identical prompt, if any."""
+        if self.draft_cache_dir is None:
+            return None
+
+        path = self._draft_path(prompt)
+        if not path.exists():
+            return None
+
+        print(f"[WRITER] Reusing cached draft {path.stem[:12]}")
+        path.touch()  # Recently used drafts survive pruning
+        return path.read_text(encoding="utf-8")
+
+    def _save_draft(self, prompt: str, content: str) -> None:
+        """Cache a generated draft under its prompt."""
+        if self.draft_cache_dir is None or not content:
+            return
+
+        path = self._draft_path(prompt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so a crash never leaves a truncated draft behind
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+
+        self._prune_drafts()
+
+    def _prune_drafts(self) -> None:
+        """Delete the least recently used drafts beyond _MAX_CACHED_DRAFTS."""
+        drafts = sorted(
+            self.draft_cache_dir.glob("*.txt"),
+            key=lambda p: p.stat().st_mtime
         )
+        for path in drafts[:-_MAX_CACHED_DRAFTS]:
+            path.unlink(missing_ok=True)
+
+    def _load_drafts(
+        self,
+        prepared: list[tuple[str, SceneDigest]]
+    ) -> tuple[list[str | None], list[int]]:
+        """
+        Look up cached drafts for prepared chapters.
+
+        Returns:
+            (draft or None per chapter, indices of chapters to generate)
+        """
+        contents = [self._load_draft(prompt) for prompt, _ in prepared]
+        missing = [i for i, content in enumerate(contents) if content is None]
+        return contents, missing
+
+    def _fill_drafts(
+        self,
+        prepared: list[tuple[str, SceneDigest]],
+        contents: list[str | None],
+        missing: list[int],
+        generated: list[str]
+    ) -> None:
+        """Slot newly generated drafts into `contents` and cache them."""
+        for i, content in zip(missing, generated):
+            contents[i] = content
+            self._save_draft(prepared[i][0], content)
+
+    def _prepare_chapter(
+        self,
+        outline: ChapterOutline,
+        memory: StoryMemory
+    ) -> tuple[str, SceneDigest]:
+        """
+        Build the writing prompt for an outline.
+
+        Returns:
+            (prompt, digest of the outline's scenes)
+        """
+        digest = self._digest_scenes(outline.scenes)
+        context = self._build_writing_context(memory, outline, digest.characters)
+        return self._create_writing_prompt(outline, context, digest), digest
+
+    def _build_chapter(
+        self,
+        outline: ChapterOutline,
+        digest: SceneDigest,
+        content: str,
+        word_count: int | None = None,
+        created_at: datetime | None = None
+    ) -> Chapter:
+        """
+        Package generated text and outline metadata into a Chapter.
 
-        # Count words
-        word_count = len(content.split())
+        Args:
+            outline: Outline the chapter was written from
+            digest: Scene digest from _prepare_chapter
+            content: Generated chapter text
+            word_count: Word count if already counted while streaming
+            created_at: Shared timestamp for chapters written in one batch
+        """
+        # Count words (unless already counted while streaming)
+        if word_count is None:
+            word_count = fast_word_count(content)
 
         print(f"[OK] Chapter written - {word_count} words")
 
         # Create Chapter object
-        chapter_id = f"ch_{outline.chapter_number:03d}"
-
         chapter = Chapter(
-            chapter_id=chapter_id,
+            chapter_id=_CHAPTER_ID_FMT(outline.chapter_number),
             chapter_number=outline.chapter_number,
             arc_id=outline.arc_id,
             title=outline.title,
@@ -70,14 +413,14 @@ class ChapterWriter:
             word_count=word_count,
             summary=outline.summary,
             key_events=outline.key_events,
-            characters_present=self._extract_characters_from_scenes(outline.scenes),
-            locations=self._extract_locations_from_scenes(outline.scenes),
+            characters_present=digest.characters,
+            locations=digest.locations,
             cliffhanger=outline.cliffhanger,
             cliffhanger_type=outline.cliffhanger_type,
             themes=outline.themes_present,
             tone="balanced",
             outline=outline,
-            created_at=datetime.now(),
+            created_at=created_at or datetime.now(),
             state_changes={}  # Will be populated by state updater
         )
 
@@ -86,7 +429,8 @@ class ChapterWriter:
     def _build_writing_context(
         self,
         memory: StoryMemory,
-        outline: ChapterOutline
+        outline: ChapterOutline,
+        character_names: list[str]
     ) -> dict:
         """Build context for writing prompt."""
         context = {
@@ -95,24 +439,34 @@ class ChapterWriter:
         }
 
         # Get character details for characters in this chapter
-        character_names = set()
-        for scene in outline.scenes:
-            character_names.update(scene.get("characters", []))
-
-        character_details = []
-        for name in character_names:
-            # Find character by name
-            for char in memory.characters.values():
-                if char.name == name:
-                    character_details.append({
-                        "name": char.name,
-                        "personality": char.personality,
-                        "speech_pattern": char.speech_pattern,
-                        "quirks": char.quirks
-                    })
-                    break
+        cast = [memory.get_character_by_name(name) for name in character_names]
+
+        # Character pack in a stable order (by ID) so identical casts produce
+        # byte-identical prompt sections
+        character_details = [
+            {
+                "name": char.name,
+                "personality": char.personality,
+                "speech_pattern": char.speech_pattern,
+                "quirks": char.quirks
+            }
+            for char in sorted(filter(None, cast), key=lambda c: c.character_id)
+        ]
 
         context["characters"] = character_details
+        context["character_pack_version"] = hashlib.sha256(
+            orjson.dumps(character_details)
+        ).hexdigest()[:12]
+        print(f"[WRITER] Character pack: {len(character_details)} card(s) "
+              f"(version {context['character_pack_version']})")
+
+        # Semantically relevant past events
+        if self.retriever and memory.chapters:
+            retrieved = self.retriever.retrieve_for_writing(
+                memory=memory,
+                query=f"{outline.summary} {' '.join(outline.key_events)}"
+            )
+            context["relevant_events"] = retrieved["relevant_events"]
 
         # Recent chapter for continuity
         recent_chapters = memory.get_recent_chapters(n=1)
@@ -128,8 +482,6 @@ class ChapterWriter:
 
     def _create_system_prompt(self) -> str:
         """Create system prompt for chapter writing."""
-        chapter_structure = self.style_guide["chapter"]
-
         return f"""You are a master manga storyteller in the style of Eiichiro Oda (One Piece).
 
 Your writing style:
@@ -141,104 +493,123 @@ Your writing style:
 - Creative metaphors and imagery
 - Pacing: Mix of fast action and slower character moments
 
-Target length: ~{chapter_structure['target_word_count']} words
+Target length: ~{self._target_wc} words
 
 Write in present tense, third person.
 Make every scene visual and emotionally engaging.
 End with the specified cliffhanger."""
 
-    def _create_writing_prompt(self, outline: ChapterOutline, context: dict) -> str:
+    def _create_writing_prompt(
+        self,
+        outline: ChapterOutline,
+        context: dict,
+        digest: SceneDigest
+    ) -> str:
         """Create the writing prompt."""
-        prompt = f"""Write Chapter {outline.chapter_number}: {outline.title}
+        parts = [_WRITING_PROMPT_HEADER, f"""Write Chapter {outline.chapter_number}: {outline.title}
 
 STORY: {context['story_title']} - {context['world_name']}
 
 CHAPTER SUMMARY:
 {outline.summary}
 
-"""
+"""]
 
         # Previous chapter context
         if "previous_chapter" in context:
             prev = context["previous_chapter"]
-            prompt += f"""PREVIOUS CHAPTER:
+            parts.append(f"""PREVIOUS CHAPTER:
 "{prev['title']}" ended with: {prev['ended_with']}
 Continue naturally from this point.
 
-"""
+""")
+
+        # Relevant past events
+        if context.get("relevant_events"):
+            parts.append("RELEVANT PAST EVENTS (for continuity):\n")
+            parts.extend(
+                f"- Ch {e['chapter_number']}: {e['event']}\n"
+                for e in context["relevant_events"]
+            )
+            parts.append("\n")
 
         # Character details
         if context.get("characters"):
-            prompt += "CHARACTER DETAILS:\n"
-            for char in context["characters"]:
-                prompt += f"- {char['name']}: {char['personality']}\n"
-                if char.get("speech_pattern"):
-                    prompt += f"  Speech: {char['speech_pattern']}\n"
-                if char.get("quirks"):
-                    prompt += f"  Quirks: {', '.join(char['quirks'])}\n"
-            prompt += "\n"
+            parts.append("CHARACTER DETAILS:\n")
+            parts.extend(
+                _render_character_card(
+                    char["name"],
+                    char["personality"],
+                    char.get("speech_pattern") or "",
+                    tuple(char.get("quirks") or ())
+                )
+                for char in context["characters"]
+            )
+            parts.append("\n")
 
         # Scene breakdown
-        prompt += "SCENE STRUCTURE:\n"
-        for i, scene in enumerate(outline.scenes, 1):
-            prompt += f"\nScene {i}: {scene.get('location', 'Unknown')}\n"
-            prompt += f"Purpose: {scene.get('purpose', 'Advance plot')}\n"
-            prompt += f"Tone: {scene.get('tone', 'balanced')}\n"
-            if scene.get("characters"):
-                prompt += f"Characters: {', '.join(scene['characters'])}\n"
-        prompt += "\n"
+        parts.append(digest.prompt_fragment)
 
         # Key events to include
-        prompt += "KEY EVENTS TO INCLUDE:\n"
-        for event in outline.key_events:
-            prompt += f"- {event}\n"
-        prompt += "\n"
+        parts.append("KEY EVENTS TO INCLUDE:\n")
+        parts.extend(f"- {event}\n" for event in outline.key_events)
+        parts.append("\n")
 
         # Character moments
         if outline.character_moments:
-            prompt += "CHARACTER DEVELOPMENT MOMENTS:\n"
-            for char, moment in outline.character_moments.items():
-                prompt += f"- {char}: {moment}\n"
-            prompt += "\n"
+            parts.append("CHARACTER DEVELOPMENT MOMENTS:\n")
+            parts.extend(
+                f"- {char}: {moment}\n"
+                for char, moment in sorted(outline.character_moments.items())
+            )
+            parts.append("\n")
 
         # Themes
         if outline.themes_present:
-            prompt += f"THEMES TO WEAVE IN: {', '.join(outline.themes_present)}\n\n"
+            parts.append(f"THEMES TO WEAVE IN: {', '.join(sorted(outline.themes_present))}\n\n")
 
         # Foreshadowing
         if outline.foreshadowing:
-            prompt += "FORESHADOWING (subtle hints):\n"
-            for hint in outline.foreshadowing:
-                prompt += f"- {hint}\n"
-            prompt += "\n"
+            parts.append("FORESHADOWING (subtle hints):\n")
+            parts.extend(f"- {hint}\n" for hint in sorted(outline.foreshadowing))
+            parts.append("\n")
 
         # Cliffhanger
-        prompt += f"""ENDING:
+        parts.append(f"""ENDING:
 Must end with this cliffhanger ({outline.cliffhanger_type}):
 {outline.cliffhanger}
 
 ---
 
-Now write the full chapter. Make it vivid, emotional, and engaging.
-Show don't tell. Use dialogue to reveal character.
-Create visual moments that would work as manga panels.
+Now write the full chapter. Begin the chapter now:""")
 
-Begin the chapter now:"""
+        return "".join(parts)
 
-        return prompt
+    def _digest_scenes(self, scenes: list[dict]) -> SceneDigest:
+        """
+        Walk the outline's scenes once, collecting unique character names and
+        locations while rendering the SCENE STRUCTURE prompt section.
 
-    def _extract_characters_from_scenes(self, scenes: list[dict]) -> list[str]:
-        """Extract unique character names from scenes."""
+        Returns:
+            SceneDigest for the scenes
+        """
         characters = set()
-        for scene in scenes:
-            characters.update(scene.get("characters", []))
-        return list(characters)
-
-    def _extract_locations_from_scenes(self, scenes: list[dict]) -> list[str]:
-        """Extract unique locations from scenes."""
         locations = set()
-        for scene in scenes:
+        parts = ["SCENE STRUCTURE:\n"]
+        for i, scene in enumerate(scenes, 1):
             loc = scene.get("location")
+            scene_chars = scene.get("characters")
+            parts.append(
+                f"\nScene {i}: {loc if 'location' in scene else 'Unknown'}\n"
+                f"Purpose: {scene.get('purpose', 'Advance plot')}\n"
+                f"Tone: {scene.get('tone', 'balanced')}\n"
+            )
+            if scene_chars:
+                characters.update(scene_chars)
+                parts.append(f"Characters: {', '.join(scene_chars)}\n")
             if loc:
                 locations.add(loc)
-        return list(locations)
+        parts.append("\n")
+        # Sorted so the digest (and the prompt built from it) doesn't depend
+        # on set iteration order
+        return SceneDigest(sorted(characters), sorted(locations), "".join(parts))
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the package importable once for the whole session
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+@pytest.fixture(scope="session")
+def llm_client():
+    """Fake LLM client shared by the whole session (no network calls)."""
+    from tests.fakes import FakeLLMClient
+    return FakeLLMClient()
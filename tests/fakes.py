@@ -0,0 +1,114 @@
+"""Test doubles for running components without network calls."""
+
+import json
+from typing import Iterator, Optional
+
+
+# Canned quality assessment (scores below the revision threshold so the
+# revision path gets exercised)
+QUALITY_RESPONSE = json.dumps({
+    "overall_score": 62,
+    "oda_style_score": 65,
+    "voice_consistency_score": 70,
+    "pacing_score": 55,
+    "has_cliffhanger": True,
+    "has_foreshadowing": True,
+    "has_callbacks": False,
+    "strengths": ["Clear cliffhanger with the mysterious figure"],
+    "suggestions": ["Show the town through action rather than summary"],
+    "needs_revision": True
+})
+
+# Canned chapter text returned for every non-assessment prompt
+REVISION_RESPONSE = """# Chapter 1: The Beginning
+
+TestHero strode through the gates of Test Town, grinning at the crowded market.
+
+"This is it!" TestHero shouted. "My journey begins here!"
+
+From the shadows of the bell tower, a cloaked figure watched, and smiled."""
+
+
+class FakeLLMClient:
+    """
+    Stand-in for LLMClient that returns canned responses.
+
+    Prompts asking for a quality assessment get QUALITY_RESPONSE; everything
+    else gets REVISION_RESPONSE. Every prompt is recorded in `calls`.
+    """
+
+    provider = "fake"
+    model = "fake"
+    default_max_tokens = 4096
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def _respond(self, prompt: str) -> str:
+        self.calls.append(prompt)
+        if '"overall_score"' in prompt:
+            return QUALITY_RESPONSE
+        return REVISION_RESPONSE
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        return self._respond(prompt)
+
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        yield self._respond(prompt)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        return self._respond(prompt)
+
+    async def agenerate_many(
+        self,
+        prompts: list[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        length_estimates: Optional[list[int]] = None,
+    ) -> list[str]:
+        return [self._respond(prompt) for prompt in prompts]
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> list[str]:
+        return [self._respond(prompt) for prompt in prompts]
+
+    async def __aenter__(self) -> "FakeLLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        pass
+
+    def is_retryable(self, error: Exception) -> bool:
+        return isinstance(error, ConnectionError)
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 4
+
+    count_tokens_estimate = count_tokens
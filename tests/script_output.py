@@ -0,0 +1,45 @@
+"""Output helpers for running test modules as scripts."""
+
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Iterator, TextIO
+
+
+@contextmanager
+def buffered_output(stream: TextIO | None = None) -> Iterator[None]:
+    """
+    Collect everything printed inside the block and write it out in one go.
+
+    The buffer is written even if the block raises, before the traceback.
+
+    Args:
+        stream: Where the output goes (default: stdout)
+    """
+    stream = stream or sys.stdout
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        stream.write(buf.getvalue())
+        stream.flush()
+
+
+def timed(name: str, test_fn, *args) -> tuple[str, bool, float]:
+    """Run a script-mode test, returning (name, passed, duration in seconds)."""
+    start = time.perf_counter()
+    passed = test_fn(*args)
+    return name, passed, time.perf_counter() - start
+
+
+def results_json(results: list[tuple[str, bool, float]]) -> str:
+    """Render test results as one JSON line."""
+    return json.dumps({
+        "results": [
+            {"name": name, "passed": passed, "duration_s": round(duration, 6)}
+            for name, passed, duration in results
+        ]
+    })
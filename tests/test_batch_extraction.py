@@ -0,0 +1,153 @@
+"""Test batched state extraction in StateUpdater.update_from_chapters."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src (and the repo root, for tests.fakes) to path when run as a script;
+# conftest.py already does this under pytest
+_ROOT = Path(__file__).resolve().parent.parent
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from story_writer.updater import StateUpdater
+from story_writer.models import StoryMemory, Chapter
+from tests.fakes import FakeLLMClient
+
+
+def _chapter(number: int) -> Chapter:
+    """Build a minimal chapter."""
+    return Chapter(
+        chapter_id=f"ch_{number:03d}",
+        chapter_number=number,
+        arc_id="arc_001",
+        title=f"Chapter {number}",
+        content=f"Events of ch_{number:03d}.",
+        word_count=4,
+        summary=f"Summary {number}",
+        cliffhanger="To be continued",
+        cliffhanger_type="mystery"
+    )
+
+
+def _changes(character: str) -> dict:
+    """Extraction result introducing one character."""
+    return {"new_characters": [{"name": character, "role": "ally"}]}
+
+
+class ScriptedExtractionClient(FakeLLMClient):
+    """
+    Fake client answering extraction prompts from a chapter ID -> changes map.
+
+    Batched prompts get one object keyed by the chapter IDs they contain,
+    minus any IDs in `omit`; every agenerate_many call is recorded as
+    (prompts, max_tokens) in `requests`.
+    """
+
+    def __init__(self, changes: dict[str, dict], omit: frozenset = frozenset()):
+        super().__init__()
+        self.changes = changes
+        self.omit = omit
+        self.requests: list[tuple[list[str], int]] = []
+
+    def _extract(self, prompt: str) -> str:
+        ids = [ch_id for ch_id in self.changes if f"Events of {ch_id}." in prompt]
+        if '<chapter id="' not in prompt:  # Single-chapter prompt
+            return json.dumps(self.changes[ids[0]])
+        return json.dumps({
+            ch_id: self.changes[ch_id] for ch_id in ids if ch_id not in self.omit
+        })
+
+    async def agenerate_many(self, prompts, system_prompt=None, temperature=None,
+                             max_tokens=None, length_estimates=None):
+        self.requests.append((prompts, max_tokens))
+        return [self._extract(prompt) for prompt in prompts]
+
+
+def _run(
+    client: FakeLLMClient,
+    chapters: list[Chapter],
+    batch_size: int = 2
+) -> tuple[StoryMemory, list[str]]:
+    """Update a fresh memory from chapters, returning it and the applied chapter IDs."""
+    updater = StateUpdater(client, extraction_batch_size=batch_size)
+    applied = []
+    apply_changes = updater._apply_changes
+
+    def record(changes, memory, chapter):
+        applied.append(chapter.chapter_id)
+        apply_changes(changes, memory, chapter)
+
+    updater._apply_changes = record
+    memory = StoryMemory(story_title="Test Story", world_name="Test World")
+    asyncio.run(updater.update_from_chapters(chapters, memory))
+    return memory, applied
+
+
+def test_keyed_batch_response():
+    """Test that a keyed batch response is split per chapter, with per-group token limits."""
+    client = ScriptedExtractionClient({
+        "ch_001": _changes("Zephyr"),
+        "ch_002": _changes("Mira"),
+        "ch_003": _changes("Kaito"),
+    })
+    memory, applied = _run(client, [_chapter(1), _chapter(2), _chapter(3)])
+
+    assert applied == ["ch_001", "ch_002", "ch_003"]
+    assert sorted(c.name for c in memory.characters.values()) == ["Kaito", "Mira", "Zephyr"]
+
+    # One 2-chapter group and one single chapter, each sized to its group
+    assert sorted((len(prompts), max_tokens) for prompts, max_tokens in client.requests) == [
+        (1, 2000), (1, 4000)
+    ]
+    assert all(max_tokens <= client.default_max_tokens for _, max_tokens in client.requests)
+
+
+def test_group_size_fits_output_limit():
+    """Test that groups shrink so no request asks for more than the model's max_tokens."""
+    client = ScriptedExtractionClient({f"ch_00{n}": _changes(f"Hero{n}") for n in range(1, 4)})
+    _run(client, [_chapter(1), _chapter(2), _chapter(3)], batch_size=3)
+
+    # 3 x 2000 tokens would exceed 4096, so the chapters go out as 2 + 1
+    assert max(max_tokens for _, max_tokens in client.requests) == 4000
+
+
+def test_missing_chapter_is_reextracted():
+    """Test that a chapter left out of a batch response is extracted on its own."""
+    client = ScriptedExtractionClient(
+        {"ch_001": _changes("Zephyr"), "ch_002": _changes("Mira")},
+        omit=frozenset({"ch_002"})
+    )
+    memory, applied = _run(client, [_chapter(1), _chapter(2)])
+
+    assert applied == ["ch_001", "ch_002"]
+    assert sorted(c.name for c in memory.characters.values()) == ["Mira", "Zephyr"]
+
+    # The retry is a single-chapter request with a single-chapter budget
+    retry_prompts, retry_max_tokens = client.requests[-1]
+    assert len(retry_prompts) == 1 and retry_max_tokens == 2000
+    assert "Events of ch_002." in retry_prompts[0]
+
+
+def test_changes_applied_in_chapter_order():
+    """Test that changes are applied by chapter number, whatever the input order."""
+    client = ScriptedExtractionClient({
+        "ch_001": _changes("Zephyr"),
+        "ch_002": _changes("Mira"),
+        "ch_003": _changes("Kaito"),
+    })
+    memory, applied = _run(client, [_chapter(3), _chapter(1), _chapter(2)])
+
+    assert applied == ["ch_001", "ch_002", "ch_003"]
+    # Character IDs are assigned in application order
+    assert [c.name for c in memory.characters.values()] == ["Zephyr", "Mira", "Kaito"]
+
+
+if __name__ == "__main__":
+    test_keyed_batch_response()
+    test_group_size_fits_output_limit()
+    test_missing_chapter_is_reextracted()
+    test_changes_applied_in_chapter_order()
+    print("[PASS] Batch extraction tests passed")
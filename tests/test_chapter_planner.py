@@ -3,8 +3,10 @@
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 
 def test_chapter_planner():
@@ -48,7 +50,6 @@ def test_chapter_planner():
             role="protagonist",
             status="active"
         )
-        memory.characters[protagonist.character_id] = protagonist
 
         # Add a companion
         companion = Character(
@@ -58,7 +59,7 @@ def test_chapter_planner():
             role="ally",
             status="active"
         )
-        memory.characters[companion.character_id] = companion
+        memory.bulk_add_characters([protagonist, companion])
 
         # Create a starting arc
         arc = Arc(
@@ -73,7 +74,7 @@ def test_chapter_planner():
             current_phase="arrival",
             status="active"
         )
-        memory.arcs[arc.arc_id] = arc
+        memory.arcs.update({arc.arc_id: arc})
         memory.current_arc_id = arc.arc_id
 
         print("[OK] Story context created")
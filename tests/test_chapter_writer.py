@@ -3,8 +3,10 @@
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 
 def test_chapter_writer():
@@ -52,7 +54,6 @@ def test_chapter_writer():
             role="protagonist",
             status="active"
         )
-        memory.characters[kael.character_id] = kael
 
         # Add companion
         finn = Character(
@@ -64,7 +65,7 @@ def test_chapter_writer():
             role="ally",
             status="active"
         )
-        memory.characters[finn.character_id] = finn
+        memory.bulk_add_characters([kael, finn])
 
         # Create arc
         arc = Arc(
@@ -79,7 +80,7 @@ def test_chapter_writer():
             current_phase="arrival",
             status="active"
         )
-        memory.arcs[arc.arc_id] = arc
+        memory.arcs.update({arc.arc_id: arc})
         memory.current_arc_id = arc.arc_id
 
         print("[OK] Story context created")
@@ -0,0 +1,69 @@
+"""Test JSON extraction and recovery for LLM responses."""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from story_writer.utils.json_utils import extract_json_block, parse_json_lenient
+
+
+def test_extract_json_block():
+    """Test stripping code fences and surrounding prose."""
+    assert extract_json_block('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert extract_json_block('```\n{"a": 1}\n```') == '{"a": 1}'
+    assert extract_json_block('Here you go:\n{"a": {"b": 2}}\nHope this helps!') == '{"a": {"b": 2}}'
+    assert extract_json_block('```json\n{"a": 1}') == '{"a": 1}'
+    assert extract_json_block('[1, 2]') == '[1, 2]'
+    assert extract_json_block('[{"a": 1}, {"b": 2}]') == '[{"a": 1}, {"b": 2}]'
+    assert extract_json_block('Here are the [updated] changes: {"a": 1}') == '{"a": 1}'
+
+
+def test_parse_clean_json():
+    """Test the strict parsing path."""
+    assert parse_json_lenient('{"new_characters": [], "major_events": []}') == {
+        "new_characters": [],
+        "major_events": []
+    }
+    assert parse_json_lenient('Changes [ch_001]:\n{"a": [1]}') == {"a": [1]}
+
+
+def test_parse_trailing_commas():
+    """Test recovery from trailing commas."""
+    assert parse_json_lenient('{"a": [1, 2,], "b": "x",}') == {"a": [1, 2], "b": "x"}
+
+
+def test_parse_truncated_response():
+    """Test recovery of complete elements from a truncated response."""
+    truncated = '```json\n{"new_characters": [{"name": "Zephyr"}, {"name": "Mi'
+    assert parse_json_lenient(truncated) == {"new_characters": [{"name": "Zephyr"}]}
+
+    dangling_key = '{"new_characters": [{"name": "Zephyr"}], "thread_upd'
+    assert parse_json_lenient(dangling_key) == {"new_characters": [{"name": "Zephyr"}]}
+
+    open_string = '{"major_events": [{"description": "The storm hit'
+    assert parse_json_lenient(open_string) == {
+        "major_events": [{"description": "The storm hit"}]
+    }
+
+
+def test_parse_failure_raises():
+    """Test that unrecoverable input still raises JSONDecodeError."""
+    try:
+        parse_json_lenient("no json here")
+    except json.JSONDecodeError:
+        return
+    raise AssertionError("Expected JSONDecodeError")
+
+
+if __name__ == "__main__":
+    test_extract_json_block()
+    test_parse_clean_json()
+    test_parse_trailing_commas()
+    test_parse_truncated_response()
+    test_parse_failure_raises()
+    print("[PASS] JSON utils tests passed")
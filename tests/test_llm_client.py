@@ -0,0 +1,198 @@
+"""Test LLMClient behavior that doesn't need a network connection."""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import openai
+
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from story_writer.utils import LLMClient, get_settings
+
+
+def _make_client() -> LLMClient:
+    """Build an OpenAI-backed client with a placeholder key (no requests are sent)."""
+    if not os.environ.get("OPENAI_API_KEY"):
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        get_settings.cache_clear()
+    return LLMClient(provider="openai")
+
+
+def _status_error(status: int, headers: dict | None = None) -> openai.APIStatusError:
+    """Build the SDK's error for an HTTP status, over a stubbed response."""
+    response = SimpleNamespace(status_code=status, headers=headers or {}, request=None)
+    return openai.APIStatusError(f"HTTP {status}", response=response, body=None)
+
+
+def test_retry_classification():
+    """Test that only transient errors are retryable."""
+    client = _make_client()
+
+    for status in (408, 409, 429, 500, 502, 503, 529):
+        assert client.is_retryable(_status_error(status)), status
+    for status in (400, 401, 403, 404, 422):
+        assert not client.is_retryable(_status_error(status)), status
+
+    assert client.is_retryable(openai.APIConnectionError(request=None))
+    assert client.is_retryable(openai.APITimeoutError(request=None))
+    assert not client.is_retryable(ValueError("bad prompt"))
+
+
+def test_retry_delay_honors_retry_after():
+    """Test that Retry-After headers set the wait, in seconds or milliseconds."""
+    client = _make_client()
+    deadline = time.monotonic() + 60
+
+    assert client._retry_delay(_status_error(429, {"retry-after": "7"}), 0, deadline) == 7.0
+    assert client._retry_delay(_status_error(429, {"retry-after-ms": "1500"}), 0, deadline) == 1.5
+
+    # HTTP-date form falls back to jittered backoff
+    delay = client._retry_delay(
+        _status_error(503, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}), 1, deadline
+    )
+    assert 0 <= delay <= 2.0
+
+
+def test_retry_delay_backoff_and_limits():
+    """Test jittered backoff bounds, fatal errors, the last attempt and the retry budget."""
+    client = _make_client()
+    client.max_retries = 10
+    deadline = time.monotonic() + 600
+
+    for attempt in range(8):
+        delay = client._retry_delay(openai.APIConnectionError(request=None), attempt, deadline)
+        assert 0 <= delay <= min(30.0, 2 ** attempt)
+
+    assert client._retry_delay(_status_error(401), 0, deadline) is None
+    assert client._retry_delay(_status_error(500), client.max_retries - 1, deadline) is None
+
+    # A wait that would end past the deadline gives up instead
+    soon = time.monotonic() + 1
+    assert client._retry_delay(_status_error(429, {"retry-after": "5"}), 0, soon) is None
+
+
+def test_generate_retries_transient_errors():
+    """Test that generate() retries a 503 and fails fast on a 401."""
+    client = _make_client()
+    errors = [_status_error(503, {"retry-after": "0"})]
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if errors:
+            raise errors.pop(0)
+        message = SimpleNamespace(content="ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    assert client.generate("prompt") == "ok"
+    assert len(calls) == 2
+
+    calls.clear()
+    errors.append(_status_error(401))
+    try:
+        client.generate("prompt")
+    except openai.APIStatusError as e:
+        assert e.status_code == 401
+    else:
+        raise AssertionError("Expected APIStatusError")
+    assert len(calls) == 1
+
+
+def test_generate_batch_reruns_failed_requests():
+    """Test that failed batch items are regenerated while successful ones are kept."""
+    client = _make_client()
+    client._submit_batch_openai = lambda requests: "batch_1"
+    client._poll_batch_openai = lambda batch_id: True
+    client._collect_batch_openai = lambda batch_id: {"req-0": "batched a", "req-2": "batched c"}
+
+    regenerated = []
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        regenerated.append(prompt)
+        message = SimpleNamespace(content=f"direct {prompt}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    assert client.generate_batch(["a", "b", "c"]) == ["batched a", "direct b", "batched c"]
+    assert regenerated == ["b"]
+
+
+def test_bucket_by_length():
+    """Test length bucketing, including bin boundaries, empty input and ordering."""
+    client = _make_client()
+    client.length_bins = [1800, 2200]
+
+    assert client.bucket_by_length([]) == []
+
+    # A length equal to a boundary belongs to the bucket above it
+    assert client.bucket_by_length([1799, 1800, 2199, 2200]) == [[0], [1, 2], [3]]
+
+    # Buckets run shortest first; input order is kept within each bucket
+    lengths = [3000, 100, 2000, 1500, 2500, 1900, 0]
+    assert client.bucket_by_length(lengths) == [[1, 3, 6], [2, 5], [0, 4]]
+
+    # Empty buckets are dropped
+    assert client.bucket_by_length([5000, 4000]) == [[0, 1]]
+
+    # No bins configured: everything in one bucket
+    client.length_bins = []
+    assert client.bucket_by_length(lengths) == [list(range(len(lengths)))]
+
+
+class _StubAsyncSDK:
+    """Async OpenAI SDK stand-in that fails once closed, like the real one."""
+
+    def __init__(self):
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        await asyncio.sleep(0.01)
+        if self.closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+        message = SimpleNamespace(content=kwargs["messages"][-1]["content"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def close(self):
+        self.closed = True
+
+
+def test_async_client_lifetime():
+    """Test that overlapping async calls share the client until the owner closes it."""
+    client = _make_client()
+    sdk = _StubAsyncSDK()
+    client._create_async_client = lambda: sdk
+
+    async def run():
+        async with client:
+            results = await asyncio.gather(
+                client.agenerate_many(["a"]),
+                client.agenerate("b")
+            )
+            assert not sdk.closed
+            return results
+
+    assert asyncio.run(run()) == [["a"], "b"]
+    assert sdk.closed
+    assert client._async_client is None
+
+
+if __name__ == "__main__":
+    test_retry_classification()
+    test_retry_delay_honors_retry_after()
+    test_retry_delay_backoff_and_limits()
+    test_generate_retries_transient_errors()
+    test_bucket_by_length()
+    test_generate_batch_reruns_failed_requests()
+    test_async_client_lifetime()
+    print("[PASS] LLM client tests passed")
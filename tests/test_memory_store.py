@@ -4,8 +4,10 @@ import sys
 from pathlib import Path
 import shutil
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 
 def test_memory_store():
@@ -43,7 +45,7 @@ def test_memory_store():
             personality="Brave and clever",
             dream="Pass all tests"
         )
-        memory.characters[char.character_id] = char
+        memory.bulk_add_characters([char])
         print(f"[OK] Added character: {char.name}")
 
         # Add a plot thread
@@ -55,7 +57,7 @@ def test_memory_store():
             setup_chapter="ch_001",
             setup_description="Testing memory persistence"
         )
-        memory.plot_threads[thread.thread_id] = thread
+        memory.plot_threads.update({thread.thread_id: thread})
         print(f"[OK] Added plot thread: {thread.name}")
 
         # Save memory
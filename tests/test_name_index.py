@@ -0,0 +1,87 @@
+"""Test StoryMemory's name lookups and the index behind them."""
+
+import sys
+from pathlib import Path
+
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from story_writer.models import StoryMemory, Character
+
+
+def _character(char_id: str, name: str) -> Character:
+    """Build a minimal character."""
+    return Character(character_id=char_id, name=name, personality="Curious")
+
+
+def _memory(*characters: Character) -> StoryMemory:
+    """Build a story memory holding the given characters."""
+    memory = StoryMemory(story_title="Test Story", world_name="Test World")
+    memory.bulk_add_characters(characters)
+    return memory
+
+
+def test_lookup_hit():
+    """Test finding a character by exact name."""
+    memory = _memory(_character("char_001", "Zephyr"), _character("char_002", "Mira"))
+    assert memory.get_character_by_name("Mira").character_id == "char_002"
+    assert memory.get_character_by_name("Zephyr").character_id == "char_001"
+
+
+def test_lookup_miss():
+    """Test that unknown names return None without rebuilding the index."""
+    memory = _memory(_character("char_001", "Zephyr"))
+    memory.get_character_by_name("Zephyr")  # Build the index
+
+    rebuilds = []
+    index = memory._character_names
+    rebuild = index.rebuild
+    index.rebuild = lambda entities: (rebuilds.append(1), rebuild(entities))
+
+    assert memory.get_character_by_name("Nobody") is None
+    assert memory.get_character_by_name("zephyr") is None  # Exact match only
+    assert memory.get_character_by_name(None) is None
+    assert rebuilds == []
+
+
+def test_lookup_after_direct_add():
+    """Test that characters added straight to the dict are found after a lookup built the index."""
+    memory = _memory(_character("char_001", "Zephyr"))
+    assert memory.get_character_by_name("Mira") is None
+
+    memory.characters["char_002"] = _character("char_002", "Mira")
+    assert memory.get_character_by_name("Mira").character_id == "char_002"
+
+
+def test_lookup_after_replace():
+    """Test that replacing a character under the same ID updates its name lookup."""
+    memory = _memory(_character("char_001", "Zephyr"))
+    assert memory.get_character_by_name("Zephyr") is not None
+
+    memory.bulk_add_characters([_character("char_001", "Captain Zephyr")])
+    assert memory.get_character_by_name("Zephyr") is None
+    assert memory.get_character_by_name("Captain Zephyr").character_id == "char_001"
+
+
+def test_lookup_duplicate_names():
+    """Test that the first character in insertion order wins for duplicate names."""
+    memory = _memory(
+        _character("char_001", "Kaito"),
+        _character("char_002", "Kaito"),
+    )
+    assert memory.get_character_by_name("Kaito").character_id == "char_001"
+
+    # Still first after more characters arrive
+    memory.characters["char_003"] = _character("char_003", "Kaito")
+    assert memory.get_character_by_name("Kaito").character_id == "char_001"
+
+
+if __name__ == "__main__":
+    test_lookup_hit()
+    test_lookup_miss()
+    test_lookup_after_direct_add()
+    test_lookup_after_replace()
+    test_lookup_duplicate_names()
+    print("[PASS] Name index tests passed")
@@ -1,10 +1,17 @@
 """Test script to verify project setup."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path (now we're in tests/, so go up one level)
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src (and the repo root, for tests.script_output) to path when run as a
+# script; conftest.py already does this under pytest
+_ROOT = Path(__file__).resolve().parent.parent
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from tests.script_output import buffered_output, results_json, timed
 
 # Simple ASCII checkmarks for Windows compatibility
 OK = "[OK]"
@@ -12,6 +19,15 @@ FAIL = "[FAIL]"
 WARN = "[WARN]"
 
 
+@lru_cache(maxsize=None)
+def _api_key_configured() -> bool:
+    """Whether an Anthropic or OpenAI key is set (environment or .env)."""
+    from story_writer.utils import get_settings
+
+    settings = get_settings()
+    return bool(settings.anthropic_api_key or settings.openai_api_key)
+
+
 def test_imports():
     """Test that all modules can be imported."""
     print("Testing imports...")
@@ -91,8 +107,8 @@ def test_models():
             story_title="Test Story",
             world_name="Test World"
         )
-        memory.characters["test_char"] = char
-        memory.plot_threads["test_thread"] = thread
+        memory.bulk_add_characters([char])
+        memory.plot_threads.update({"test_thread": thread})
 
         print(f"{OK} Created StoryMemory with {len(memory.characters)} character(s)")
 
@@ -109,9 +125,15 @@ def test_llm_client():
     print("\nTesting LLM client...")
 
     try:
+        # Without a key client creation can only fail, so skip it
+        if not _api_key_configured():
+            print(f"{WARN} Skipping - LLM client creation requires API key (expected)")
+            print("  Set ANTHROPIC_API_KEY or OPENAI_API_KEY in .env file")
+            return True
+
         from story_writer.utils import create_client
 
-        # This will fail if no API key is set, which is expected
+        # A key for a provider other than the configured one still fails here
         try:
             client = create_client()
             print(f"{OK} LLM client created - Provider: {client.provider}")
@@ -132,42 +154,63 @@ def test_llm_client():
         return False
 
 
-def main():
-    """Run all tests."""
+def main(human: bool = False) -> list[tuple[str, bool, float]]:
+    """
+    Run all tests.
+
+    Args:
+        human: Also print a readable summary of the results
+
+    Returns:
+        (name, passed, duration in seconds) per test
+    """
     print("=" * 60)
     print("Story Writer Setup Test")
     print("=" * 60)
 
-    results = []
+    results = [
+        timed("Imports", test_imports),
+        timed("Configuration", test_config),
+        timed("Data Models", test_models),
+        timed("LLM Client", test_llm_client),
+    ]
+    all_passed = all(passed for _, passed, _ in results)
 
-    results.append(("Imports", test_imports()))
-    results.append(("Configuration", test_config()))
-    results.append(("Data Models", test_models()))
-    results.append(("LLM Client", test_llm_client()))
+    if not human:
+        return results
 
     print("\n" + "=" * 60)
     print("Test Results:")
     print("=" * 60)
 
-    for name, passed in results:
+    for name, passed, _ in results:
         status = "[PASS]" if passed else "[FAIL]"
         print(f"{status} - {name}")
 
-    all_passed = all(result[1] for result in results)
-
     print("=" * 60)
     if all_passed:
         print("[OK] All tests passed! Setup is complete.")
         print("\nNext steps:")
-        print("1. Copy .env.template to .env")
-        print("2. Add your API key to .env")
-        print("3. Install dependencies: pip install -e .")
-        print("4. Start building the story system!")
+        if _api_key_configured():
+            print("1. Install dependencies: pip install -e .")
+            print("2. Start building the story system!")
+        else:
+            print("1. Copy .env.template to .env")
+            print("2. Add your API key to .env")
+            print("3. Install dependencies: pip install -e .")
+            print("4. Start building the story system!")
     else:
         print("[FAIL] Some tests failed. Please check the errors above.")
 
-    return 0 if all_passed else 1
+    return results
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    human = "--human" in sys.argv[1:]
+    # Without --human, stdout carries only the JSON results line and the
+    # test log goes to stderr
+    with buffered_output(sys.stdout if human else sys.stderr):
+        results = main(human)
+    if not human:
+        print(results_json(results))
+    sys.exit(0 if all(passed for _, passed, _ in results) else 1)
@@ -0,0 +1,64 @@
+"""Test word counting helpers."""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add src to path (conftest.py already does this under pytest)
+_SRC = str((Path(__file__).parent.parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from story_writer.utils.text_utils import WordCounter, fast_word_count
+
+
+SAMPLE = "The Grand Line  stretched ahead.\n\n\"Land ho!\" shouted\tZephyr. " * 50
+
+
+def test_word_counter_matches_split():
+    """Test that chunked counting matches split() for arbitrary chunk boundaries."""
+    rng = random.Random(7)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(SAMPLE)), 40))
+        counter = WordCounter()
+        for start, end in zip([0] + cuts, cuts + [len(SAMPLE)]):
+            counter.feed(SAMPLE[start:end])
+        assert counter.count == len(SAMPLE.split())
+
+
+def test_fast_word_count():
+    """Test fast_word_count on short, empty and multi-window texts."""
+    assert fast_word_count("") == 0
+    assert fast_word_count("   ") == 0
+    assert fast_word_count(SAMPLE) == len(SAMPLE.split())
+
+    long_text = SAMPLE * 200  # Spans several counting windows
+    assert fast_word_count(long_text) == len(long_text.split())
+
+
+def _peak_memory(fn, text: str) -> int:
+    """Peak bytes allocated while running fn(text)."""
+    tracemalloc.start()
+    try:
+        fn(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_fast_word_count_memory():
+    """Test that counting a chapter-sized text doesn't build the full word list."""
+    chapter = SAMPLE * 45  # ~4000 words, a typical chapter
+    assert fast_word_count(chapter) == len(chapter.split())
+
+    split_peak = _peak_memory(lambda text: len(text.split()), chapter)
+    windowed_peak = _peak_memory(fast_word_count, chapter)
+    assert windowed_peak * 3 < split_peak, (windowed_peak, split_peak)
+
+
+if __name__ == "__main__":
+    test_word_counter_matches_split()
+    test_fast_word_count()
+    test_fast_word_count_memory()
+    print("[PASS] Text utils tests passed")
@@ -5,35 +5,65 @@ Test thread deduplication in Phase 4.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+
+# Add src (and the repo root, for tests.*) to path when run as a
+# script; conftest.py already does this under pytest
+_ROOT = Path(__file__).resolve().parent.parent
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from story_writer.updater import StateUpdater
 from story_writer.models import StoryMemory, Chapter, PlotThread
-from story_writer.utils import create_client
+from tests.fakes import FakeLLMClient
+from tests.script_output import buffered_output, results_json, timed
+
+
+# (input name, expected normalized name)
+NORMALIZATION_CASES = [
+    ("Wind Walker Prophecy", "wind walker prophecy"),
+    ("The Wind Walker prophecy", "wind walker prophecy"),
+    ("wind walker prophecy", "wind walker prophecy"),
+    ("A mysterious map", "mysterious map"),
+    ("The Ancient Ruins", "ancient ruins"),
+    # Only "the " / "a " / "an " with a single space count as articles
+    ("The\tLost Map", "the lost map"),
+    ("A An Omen", "omen"),
+    ("An Apple a Day", "apple a day"),
+]
+
 
+@pytest.fixture(scope="module")
+def updater(llm_client):
+    """StateUpdater shared by the tests in this module."""
+    return StateUpdater(llm_client)
 
-def test_thread_normalization():
+
+@pytest.mark.parametrize("input_name,expected", NORMALIZATION_CASES)
+def test_thread_normalization(updater, input_name, expected):
     """Test that thread names are normalized correctly."""
-    client = create_client()
-    updater = StateUpdater(client)
-
-    # Test cases
-    test_cases = [
-        ("Wind Walker Prophecy", "wind walker prophecy"),
-        ("The Wind Walker prophecy", "wind walker prophecy"),
-        ("wind walker prophecy", "wind walker prophecy"),
-        ("A mysterious map", "mysterious map"),
-        ("The Ancient Ruins", "ancient ruins"),
+    assert updater._normalize_thread_name(input_name) == expected
+
+
+def test_thread_normalization_batch(updater):
+    """Test that batched normalization matches the expected names in order."""
+    names = [name for name, _ in NORMALIZATION_CASES]
+    assert updater._normalize_thread_names(names) == [
+        expected for _, expected in NORMALIZATION_CASES
     ]
 
+
+def _report_normalization(updater) -> bool:
+    """Print per-case normalization results (script mode)."""
     print("\n" + "=" * 60)
     print("TEST: Thread Name Normalization")
     print("=" * 60)
 
+    results = updater._normalize_thread_names([name for name, _ in NORMALIZATION_CASES])
+
     all_passed = True
-    for input_name, expected in test_cases:
-        result = updater._normalize_thread_name(input_name)
+    for (input_name, expected), result in zip(NORMALIZATION_CASES, results):
         passed = result == expected
         status = "[PASS]" if passed else "[FAIL]"
         print(f"{status}: '{input_name}' -> '{result}' (expected: '{expected}')")
@@ -43,11 +73,8 @@ def test_thread_normalization():
     return all_passed
 
 
-def test_thread_deduplication():
+def test_thread_deduplication(updater):
     """Test that duplicate threads are not created."""
-    client = create_client()
-    updater = StateUpdater(client)
-
     # Create test memory with existing thread
     memory = StoryMemory(
         story_title="Test Story",
@@ -64,7 +91,7 @@ def test_thread_deduplication():
         setup_description="A prophecy about the Wind Walker",
         status="open"
     )
-    memory.plot_threads["thread_001"] = thread1
+    memory.plot_threads.update({thread1.thread_id: thread1})
 
     print("\n" + "=" * 60)
     print("TEST: Thread Deduplication")
@@ -92,6 +119,7 @@ def test_thread_deduplication():
         {"action": "introduce", "thread_name": "Wind Walker Prophecy", "description": "Exact duplicate"},
     ]
 
+    # One batched call: dedup sees all three candidates at once
     print("\nAttempting to add 3 duplicate threads...")
     updater._apply_thread_updates(duplicate_threads, memory, chapter)
 
@@ -104,31 +132,54 @@ def test_thread_deduplication():
     status = "[PASS]" if passed else "[FAIL]"
     print(f"\n{status}: Expected 1 thread, got {len(memory.plot_threads)}")
 
+    assert len(memory.plot_threads) == 1
     return passed
 
 
-def main():
-    """Run all tests."""
+def main(human: bool = False) -> list[tuple[str, bool, float]]:
+    """
+    Run all tests.
+
+    Args:
+        human: Also print a readable summary of the results
+
+    Returns:
+        (name, passed, duration in seconds) per test
+    """
     print("\n" + "=" * 60)
     print("PHASE 4: THREAD DEDUPLICATION TESTS")
     print("=" * 60)
 
-    test1_passed = test_thread_normalization()
-    test2_passed = test_thread_deduplication()
+    updater = StateUpdater(FakeLLMClient())
+
+    results = [
+        timed("Thread Normalization", _report_normalization, updater),
+        timed("Thread Deduplication", test_thread_deduplication, updater),
+    ]
+    all_passed = all(passed for _, passed, _ in results)
+
+    if not human:
+        return results
 
     print("\n" + "=" * 60)
     print("TEST RESULTS")
     print("=" * 60)
-    print(f"Thread Normalization: {'[PASS]' if test1_passed else '[FAIL]'}")
-    print(f"Thread Deduplication: {'[PASS]' if test2_passed else '[FAIL]'}")
+    for name, passed, _ in results:
+        print(f"{name}: {'[PASS]' if passed else '[FAIL]'}")
 
-    if test1_passed and test2_passed:
+    if all_passed:
         print("\n[SUCCESS] ALL TESTS PASSED!")
-        return 0
     else:
         print("\n[ERROR] SOME TESTS FAILED")
-        return 1
+    return results
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    human = "--human" in sys.argv[1:]
+    # Without --human, stdout carries only the JSON results line and the
+    # test log goes to stderr
+    with buffered_output(sys.stdout if human else sys.stderr):
+        results = main(human)
+    if not human:
+        print(results_json(results))
+    sys.exit(0 if all(passed for _, passed, _ in results) else 1)